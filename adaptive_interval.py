@@ -0,0 +1,69 @@
+import threading
+
+class AdaptiveIntervalPolicy:
+    """
+    피드(키워드/국가)별 폴링 간격 조절
+    - 폴링마다 새 링크 수의 지수 이동 평균(EWMA)을 계산
+    - 평균이 busy_threshold 이상이면 간격을 shrink_factor배로 줄이고 (속보 키워드)
+      quiet_threshold 미만이면 grow_factor배로 늘림 (조용한 키워드)
+    - 간격은 항상 min_interval ~ max_interval초 사이
+    """
+    def __init__(self, min_interval=10, max_interval=900, initial_interval=60, grow_factor=1.5, shrink_factor=0.5,
+                 busy_threshold=5, quiet_threshold=0.5, smoothing=0.5):
+        if not min_interval <= initial_interval <= max_interval:
+            raise ValueError("min_interval <= initial_interval <= max_interval 이어야 합니다")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval
+        self.grow_factor = grow_factor
+        self.shrink_factor = shrink_factor
+        self.busy_threshold = busy_threshold
+        self.quiet_threshold = quiet_threshold
+        self.smoothing = smoothing
+        self.feeds = {}
+        self.lock = threading.Lock()
+
+    def _feed(self, key):
+        if key not in self.feeds:
+            self.feeds[key] = {
+                'interval': self.initial_interval,
+                'avg_new': None,
+                'polls': 0,
+                'empty_polls': 0,
+                'new_links': 0,
+            }
+        return self.feeds[key]
+
+    def get_interval(self, key):
+        with self.lock:
+            return self._feed(key)['interval']
+
+    def set_interval(self, key, seconds):
+        """저장해 둔 간격으로 시작 (재시작 후 이어서 조절)"""
+        with self.lock:
+            self._feed(key)['interval'] = max(self.min_interval, min(self.max_interval, seconds))
+
+    def record(self, key, new_links):
+        """폴링 결과 기록 후 다음 간격(초) 반환"""
+        with self.lock:
+            item = self._feed(key)
+            item['polls'] += 1
+            item['new_links'] += new_links
+            item['empty_polls'] += 0 if new_links else 1
+            if item['avg_new'] is None:
+                item['avg_new'] = float(new_links)
+            else:
+                item['avg_new'] = self.smoothing * new_links + (1 - self.smoothing) * item['avg_new']
+
+            interval = item['interval']
+            if item['avg_new'] >= self.busy_threshold:
+                interval *= self.shrink_factor
+            elif item['avg_new'] < self.quiet_threshold:
+                interval *= self.grow_factor
+            item['interval'] = max(self.min_interval, min(self.max_interval, interval))
+            return item['interval']
+
+    def get_stats(self):
+        """피드별 현재 간격 / 새 링크 평균 / 폴링 수 / 새 링크가 없던 폴링 수"""
+        with self.lock:
+            return {key: dict(item) for key, item in self.feeds.items()}
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class AsyncContentFetcher:
+    """
+    여러 기사 본문을 동시에 가져오는 비동기 크롤링 엔진
+    - fetch_func: url 하나를 받아 결과를 돌려주는 동기 함수 (예: GoogleNewsCron.get_content)
+    - max_concurrency: 동시에 진행할 최대 요청 수 (전역 제한 - 여러 스레드에서 fetch_all을 동시에 불러도
+      같은 세마포어/스레드 풀을 공유하므로 합계가 max_concurrency를 넘지 않음)
+    - extract_func / extract_executor: 지정하면 fetch_func 결과를 extract_executor(프로세스 풀 등)에서
+      extract_func로 후처리 (네트워크 슬롯은 추출을 기다리지 않고 바로 반환)
+    """
+    def __init__(self, fetch_func, max_concurrency=10, extract_func=None, extract_executor=None):
+        self.fetch_func = fetch_func
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.extract_func = extract_func
+        self.extract_executor = extract_executor
+        self.error_result = "크롤링 오류"
+        self.semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        # 블로킹 requests 호출은 인스턴스 전용 스레드 풀에서 실행
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='content-fetch')
+
+    def _fetch_limited(self, url):
+        with self.semaphore:
+            return self.fetch_func(url)
+
+    async def _fetch_one(self, loop, url):
+        result = await loop.run_in_executor(self.executor, self._fetch_limited, url)
+        if self.extract_func is not None:
+            result = await loop.run_in_executor(self.extract_executor, self.extract_func, result)
+        return result
+
+    async def fetch_all_async(self, urls):
+        """urls 순서 그대로 결과 리스트 반환"""
+        loop = asyncio.get_running_loop()
+        tasks = [self._fetch_one(loop, url) for url in urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 예외가 새어 나오면 기존 get_content와 같은 실패 문자열로 맞춤
+        return [self.error_result if isinstance(result, Exception) else result for result in results]
+
+    def fetch_all(self, urls):
+        """동기 코드(APScheduler 작업 스레드)에서 호출하는 진입점"""
+        urls = list(urls)
+        if not urls:
+            return []
+        return asyncio.run(self.fetch_all_async(urls))
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
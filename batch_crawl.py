@@ -0,0 +1,112 @@
+import argparse
+import time
+from concurrent.futures import wait
+
+from google_news_cron import GoogleNewsCron
+from google_news_dbmanager import GoogleNewsDBManager
+from crawl_budget import CrawlBudget
+
+def load_keywords_file(path, country='ko'):
+    """
+    키워드 파일 읽기 - 한 줄에 하나씩 '키워드' 또는 '키워드,국가' (# 이후는 주석)
+    반환값: [(키워드, 국가), ...] (중복 제거, 파일 순서 유지)
+    """
+    keywords = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            keyword, _, keyword_country = line.partition(',')
+            keyword = keyword.strip()
+            if keyword:
+                keywords.setdefault(keyword, keyword_country.strip() or country)
+    return list(keywords.items())
+
+def load_keywords_table():
+    """keyword 테이블에 등록된 키워드 [(키워드, 국가), ...]"""
+    dbManager = GoogleNewsDBManager()
+    try:
+        dbManager.queryCreateKeywordTable()
+        return [(row['keyword'], row['country']) for row in dbManager.querySelectAllKeywordTable()]
+    finally:
+        dbManager.stop()
+
+def result_status(item):
+    """요약에 쓸 상태 - 피드 요청 자체가 실패한 경우(429 등)는 본문 채우기 오류와 구분해 'feed_error'"""
+    return 'feed_error' if item.get('feed_error') else item['status']
+
+def print_summary(results, elapsed):
+    """키워드별 새 기사 / 본문 실패 / 소요 시간 요약"""
+    print(f"\n📋 일괄 수집 결과 ({len(results)}개 키워드, {elapsed:.1f}초)")
+    print(f"   {'키워드':<20} {'국가':<4} {'상태':<10} {'새 기사':>6} {'본문':>6} {'실패':>6} {'시간':>8}")
+    for item in results:
+        print(f"   {item['keywords'][0]:<20} {item['country']:<4} {result_status(item):<10} {item['new_articles']:>6} "
+              f"{item['filled']:>6} {item['failed']:>6} {item['elapsed']:>7.1f}초")
+
+    counts = {}
+    for item in results:
+        status = result_status(item)
+        counts[status] = counts.get(status, 0) + 1
+    print(f"   합계: 새 기사 {sum(item['new_articles'] for item in results)}개, "
+          f"본문 실패 {sum(item['failed'] for item in results)}개, "
+          + ', '.join(f"{status} {count}개" for status, count in sorted(counts.items())))
+
+def batch_crawl(keywords, workers=4, concurrency=10, time_budget=None, grace=30, cron=None):
+    """
+    키워드들을 workers개씩 병렬로 한 번 수집
+    time_budget: 전체 제한 시간(초) - 지나면 아직 시작하지 않은 키워드는 'cancelled',
+                 진행 중인 키워드는 grace초 더 기다린 뒤에도 안 끝나면 'timeout'
+    반환값: 키워드별 실행 통계 목록 (GoogleNewsCron.run과 같은 형식, 입력 순서)
+    """
+    own_cron = cron is None
+    cron = cron or GoogleNewsCron(max_concurrency=concurrency, feed_workers=workers, enrich_workers=workers,
+                                  budget=CrawlBudget(concurrency))
+    started = time.monotonic()
+    print(f"🚀 일괄 수집 시작: 키워드 {len(keywords)}개, 작업자 {workers}개"
+          + (f", 제한 시간 {time_budget}초" if time_budget else ""))
+
+    futures = [cron.run(mode='once', country=country, keyword=keyword) for keyword, country in keywords]
+    _, not_done = wait(futures, timeout=time_budget)
+    if not_done:
+        # 시작하지 않은 키워드는 취소하고, 진행 중인 키워드만 조금 더 기다림
+        running = [future for future in not_done if not future.cancel()]
+        print(f"⏰ 제한 시간 초과: {len(not_done) - len(running)}개 취소, 진행 중 {len(running)}개 대기 (최대 {grace}초)")
+        _, not_done = wait(running, timeout=grace)
+
+    results = []
+    for (keyword, country), future in zip(keywords, futures):
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+            continue
+        results.append({
+            'country': country,
+            'keywords': [keyword],
+            'status': 'cancelled' if future.cancelled() else 'timeout',
+            'new_articles': 0,
+            'filled': 0,
+            'failed': 0,
+            'feed_error': False,
+            'elapsed': 0.0 if future.cancelled() else time.monotonic() - started,
+        })
+
+    if own_cron:
+        cron.stop(wait=not not_done)
+    print_summary(results, time.monotonic() - started)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='여러 키워드를 병렬로 한 번 수집하고 키워드별 결과 요약')
+    parser.add_argument('keywords_file', nargs='?', help="키워드 파일 (한 줄에 '키워드' 또는 '키워드,국가', 없으면 keyword 테이블)")
+    parser.add_argument('--country', default='ko', help='키워드 파일에 국가가 없을 때 기본 국가')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 수집하는 키워드 수')
+    parser.add_argument('--concurrency', type=int, default=10, help='전체 동시 요청 수')
+    parser.add_argument('--time-budget', type=float, default=None, help='전체 제한 시간 (초)')
+    parser.add_argument('--grace', type=float, default=30, help='제한 시간 후 진행 중인 키워드를 더 기다리는 시간 (초)')
+    args = parser.parse_args()
+
+    keywords = load_keywords_file(args.keywords_file, args.country) if args.keywords_file else load_keywords_table()
+    if not keywords:
+        print("❌ 수집할 키워드가 없습니다")
+    else:
+        batch_crawl(keywords, args.workers, args.concurrency, args.time_budget, args.grace)
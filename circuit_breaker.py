@@ -0,0 +1,106 @@
+import threading
+import time
+
+CLOSED = 'closed'        # 정상 - 요청 허용
+OPEN = 'open'            # 차단 - 대기 시간이 끝날 때까지 요청 건너뜀
+HALF_OPEN = 'half_open'  # 시험 - 요청 하나만 보내 회복 여부 확인
+
+# 이 상태 코드는 호스트가 우리를 막고 있거나 장애 중이라는 뜻으로 보고 실패 처리
+FAILURE_STATUS_CODES = (403, 429)
+
+class DomainCircuitBreaker:
+    """
+    도메인별 서킷 브레이커
+    - 연속 실패가 failure_threshold번 쌓이면 차단(open)
+    - 차단 시간은 base_backoff초에서 시작해 시험 요청이 실패할 때마다 2배 (최대 max_backoff초)
+    - 차단 시간이 지나면 시험 요청 하나만 보내고, 성공하면 정상(closed)으로 복귀
+    - 시험 요청 결과가 probe_timeout초 안에 기록되지 않으면 실패로 보고 다시 차단
+    """
+    def __init__(self, failure_threshold=3, base_backoff=30, max_backoff=3600, probe_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.probe_timeout = probe_timeout
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def _host(self, host):
+        if host not in self.hosts:
+            self.hosts[host] = {
+                'state': CLOSED,
+                'failures': 0,
+                'trips': 0,
+                'open_until': 0.0,
+                'probe_until': 0.0,
+                'skipped': 0,
+                'last_error': None,
+            }
+        return self.hosts[host]
+
+    def is_failure_status(self, status_code):
+        return status_code in FAILURE_STATUS_CODES or status_code >= 500
+
+    def allow(self, host):
+        """요청을 보내도 되는지 (차단 중이면 False, 차단 시간이 끝났으면 시험 요청 1개 허용)"""
+        with self.lock:
+            item = self._host(host)
+            if item['state'] == CLOSED:
+                return True
+
+            now = time.monotonic()
+            if item['state'] == HALF_OPEN and now >= item['probe_until']:
+                # 결과가 기록되지 않은 시험 요청 (중간에 빠져나간 경로 등) - 실패로 보고 다시 차단
+                item['last_error'] = '시험 요청 응답 없음'
+                self._trip(host, item)
+
+            if item['state'] == OPEN and now >= item['open_until']:
+                item['state'] = HALF_OPEN
+                item['probe_until'] = now + self.probe_timeout
+                return True
+
+            item['skipped'] += 1
+            return False
+
+    def record_success(self, host):
+        with self.lock:
+            item = self._host(host)
+            item['state'] = CLOSED
+            item['failures'] = 0
+            item['trips'] = 0
+            item['last_error'] = None
+
+    def record_failure(self, host, reason=None):
+        with self.lock:
+            item = self._host(host)
+            item['failures'] += 1
+            item['last_error'] = reason
+
+            if item['state'] == HALF_OPEN or item['failures'] >= self.failure_threshold:
+                self._trip(host, item)
+
+    def _trip(self, host, item):
+        """차단(open) - 차단할 때마다 대기 시간 2배 (lock 안에서 호출)"""
+        backoff = min(self.max_backoff, self.base_backoff * (2 ** item['trips']))
+        item['trips'] += 1
+        item['state'] = OPEN
+        item['open_until'] = time.monotonic() + backoff
+        print(f"   🚧 {host} 차단: {backoff}초 후 재시도 (연속 실패 {item['failures']}회)")
+
+    def get_stats(self):
+        """호스트별 상태 (retry_in: 다음 시험 요청까지 남은 초)"""
+        now = time.monotonic()
+        with self.lock:
+            result = {}
+            for host, item in self.hosts.items():
+                stats = dict(item)
+                stats['retry_in'] = max(0.0, item['open_until'] - now) if item['state'] == OPEN else 0.0
+                del stats['open_until']
+                del stats['probe_until']
+                result[host] = stats
+            return result
+
+    def get_open_hosts(self):
+        return [host for host, stats in self.get_stats().items() if stats['state'] != CLOSED]
+
+# 모든 크롤러가 공유하는 기본 브레이커
+shared_breaker = DomainCircuitBreaker()
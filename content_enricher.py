@@ -0,0 +1,59 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class ContentEnricher:
+    """
+    2단계 수집의 본문 채우기 단계
+    - 1단계(GoogleNewsCron.ingest_entries)가 제목/출처/날짜/링크를 먼저 저장하면
+      이 작업자 풀이 본문을 크롤링해 content만 갱신
+    - 실패한 기사는 재시도 대기열의 백오프 규칙을 그대로 따름
+    """
+    def __init__(self, fetcher, dbManager, retryQueue, workers=2, pending_grace=600):
+        self.fetcher = fetcher
+        self.dbManager = dbManager
+        self.retryQueue = retryQueue
+        # 이 시간 안에 본문을 못 채우면(프로세스 종료 등) 재시도 작업자가 이어받음
+        self.pending_grace = pending_grace
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='enricher')
+        self.lock = threading.Lock()
+        self.stats = {'batches': 0, 'pending': 0, 'filled': 0, 'failed': 0}
+
+    def submit(self, targets):
+        """
+        targets: {링크: [키워드, ...]}
+        반환값: 본문 채우기가 끝나면 완료되는 Future
+        """
+        with self.lock:
+            self.stats['batches'] += 1
+            self.stats['pending'] += len(targets)
+        return self.executor.submit(self._enrich, dict(targets))
+
+    def _enrich(self, targets):
+        links = list(targets)
+        contents = self.fetcher.fetch_all(links)
+
+        filled = failed = 0
+        for link, content in zip(links, contents):
+            for keyword in targets[link]:
+                if self.retryQueue.is_retryable(content):
+                    # 첫 시도 실패로 기록하고 백오프 후 재시도 작업자에게 넘김
+                    self.dbManager.queryUpdateGoogleNewsContent(keyword, link, content)
+                    self.retryQueue.mark_failure(keyword, link, 0, content)
+                    failed += 1
+                else:
+                    self.retryQueue.mark_success(keyword, link, content)
+                    filled += 1
+
+        with self.lock:
+            self.stats['pending'] -= len(links)
+            self.stats['filled'] += filled
+            self.stats['failed'] += failed
+        print(f"🧩 본문 채우기 완료: 성공 {filled}개, 실패 {failed}개")
+        return {'filled': filled, 'failed': failed}
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
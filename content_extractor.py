@@ -0,0 +1,72 @@
+from html_parser_backend import make_soup
+from selector_matcher import SelectorMatcher
+from stage_timer import shared_timer
+
+# GoogleNewsCron.get_content 본문 선택자 (우선순위 순)
+NEWS_SELECTORS = [
+    '#dic_area',        # 네이버 뉴스
+    '.article_view',    # 다음 뉴스
+    '.article-body',    # 일반적인 패턴
+    '.article_body',    # 변형
+    'article',          # HTML5 article 태그
+    '.content',         # 일반적인 content 클래스
+    '.post-content',    # 블로그 스타일
+    '.entry-content'    # 워드프레스
+]
+
+NEWS_MATCHER = SelectorMatcher(NEWS_SELECTORS)
+
+MIN_CONTENT_LENGTH = 100
+MAX_CONTENT_LENGTH = 1500
+
+def extract_news_content(soup):
+    """
+    GoogleNewsCron 본문 추출 규칙
+    반환값: (내용, 방법) - 방법은 'selector' 또는 'p', 실패 시 (None, None)
+    """
+    # 선택자 8개와 p 태그를 DOM 한 번 순회로 수집한 뒤 우선순위대로 검사
+    matches = NEWS_MATCHER.collect(soup)
+    selector, content = NEWS_MATCHER.first_match(matches, MIN_CONTENT_LENGTH, first_only=True)
+    if content:
+        return content, 'selector'
+
+    paragraphs = matches['p']
+    if paragraphs:
+        content = ' '.join([p.get_text(strip=True) for p in paragraphs])
+        if len(content) > MIN_CONTENT_LENGTH:
+            return content, 'p'
+
+    return None, None
+
+def extract_news_content_from_html(html, parser=None):
+    """HTML 바이트/문자열에서 바로 추출 (잘라내기 전 전체 길이의 내용 반환)"""
+    with shared_timer.measure('parse'):
+        soup = make_soup(html, parser)
+    with shared_timer.measure('extract'):
+        return extract_news_content(soup)
+
+def extract_news_result(download_result):
+    """
+    GoogleNewsCron 추출 단계 (프로세스 풀에서도 실행 가능한 모듈 함수)
+    download_result: GoogleNewsCron.download()의 반환값 (HTML 바이트, 실패 상태)
+    반환값: 저장할 content 문자열
+    """
+    html, status = download_result
+    if html is None:
+        return status
+
+    try:
+        content, method = extract_news_content_from_html(html)
+    except Exception as e:
+        print(f"   ❌ 오류: {str(e)[:30]}")
+        return "크롤링 오류"
+
+    if content:
+        if method == 'p':
+            print(f"   ✅ p태그로 성공! 길이: {len(content)}자")
+        else:
+            print(f"   ✅ 성공! 길이: {len(content)}자")
+        return content[:MAX_CONTENT_LENGTH]
+
+    print("   ❌ 내용 추출 실패")
+    return "내용 추출 실패"
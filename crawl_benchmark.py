@@ -0,0 +1,256 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from xml.sax.saxutils import escape
+
+from http_replay import HttpRecorder, ReplayServer
+from politeness_scheduler import DomainPolitenessScheduler
+from circuit_breaker import DomainCircuitBreaker
+from link_resolver import LinkResolver
+from selector_stats import AdaptiveSelectorStore
+from parser_benchmark import build_sample_pages
+from stage_timer import shared_timer
+from robots_cache import RobotsCache
+
+def build_corpus(recorder, feed_urls, articles_per_feed, hosts):
+    """
+    합성 RSS/기사 데이터를 재생 서버 기록 형식으로 생성
+    feed_urls: {키워드: 피드 URL}
+    반환값: 기사 URL 목록
+    """
+    templates = list(build_sample_pages().values())
+    published = datetime(2025, 6, 28, 8, 0, 0, tzinfo=timezone.utc)
+    article_urls = []
+
+    for k, (keyword, feed_url) in enumerate(sorted(feed_urls.items())):
+        items = []
+        for i in range(articles_per_feed):
+            n = k * articles_per_feed + i
+            url = f"https://bench{n % hosts}.example/news/{k}/{i}"
+            article_urls.append(url)
+            html = templates[n % len(templates)].replace('</body>', f'<p>기사 번호 {n}</p></body>')
+            recorder.add(url, html.encode('utf-8'))
+
+            pub_date = format_datetime(published - timedelta(minutes=n), usegmt=True)
+            items.append(
+                f"<item><title>{escape(keyword)} 관련 뉴스 {i} - 벤치마크{n % hosts}</title><link>{url}</link>"
+                f"<pubDate>{pub_date}</pubDate><source url=\"https://bench{n % hosts}.example\">벤치마크{n % hosts}</source>"
+                f"<description>{escape(keyword)} 요약 {i}</description></item>"
+            )
+
+        feed = (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>{escape(keyword)}</title>'
+                f'<lastBuildDate>{format_datetime(published, usegmt=True)}</lastBuildDate>{"".join(items)}</channel></rss>')
+        recorder.add(feed_url, feed.encode('utf-8'), content_type='application/rss+xml; charset=utf-8')
+    return article_urls
+
+def get_resource_usage():
+    """
+    (CPU 시간 초, 최대 RSS MB) - ru_maxrss 단위는 리눅스 KB, macOS 바이트
+    자식 프로세스 값은 종료/회수된 프로세스만 포함하므로 측정 구간 안에서 작업 프로세스를 종료해야 함
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+    peak = max(usage.ru_maxrss, children.ru_maxrss)
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    return cpu, peak_mb
+
+def get_pool_cpu(pool):
+    """
+    추출 프로세스 풀 작업자의 CPU 시간 합 (초, 리눅스 /proc 기준 - 다른 OS는 0)
+    forkserver 작업자는 이 프로세스의 자식이 아니라 RUSAGE_CHILDREN에 잡히지 않으므로 따로 더함
+    (직접 자식인 spawn 작업자는 종료 후 RUSAGE_CHILDREN에 포함되므로 제외)
+    """
+    total = 0.0
+    ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+    for pid in list((getattr(pool, '_processes', None) or {}).keys()):
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) != os.getpid():
+            total += (int(fields[11]) + int(fields[12])) / ticks
+    return total
+
+def measure_phase(name, articles, func, extra_cpu=None):
+    """
+    func 실행 시간/CPU/단계별 지연 측정
+    extra_cpu: func 실행 후 호출해 자원 사용량에 잡히지 않은 CPU 시간(초)을 더할 함수
+    """
+    shared_timer.reset()
+    cpu_start, _ = get_resource_usage()
+    started = time.perf_counter()
+    extracted = func()
+    elapsed = time.perf_counter() - started
+    cpu_end, peak_mb = get_resource_usage()
+    if extra_cpu:
+        cpu_end += extra_cpu()
+
+    result = {
+        'articles': articles,
+        'extracted': extracted,
+        'elapsed_sec': elapsed,
+        'articles_per_sec': articles / elapsed if elapsed else 0.0,
+        'cpu_sec': cpu_end - cpu_start,
+        'peak_rss_mb': peak_mb,
+        'stages': shared_timer.get_stats(),
+    }
+    print(f"🏁 {name}: 기사 {articles}개 ({extracted}개 추출) {elapsed:.2f}초, "
+          f"{result['articles_per_sec']:.1f}개/초, CPU {result['cpu_sec']:.2f}초, 최대 RSS {peak_mb:.1f}MB")
+    shared_timer.print_stats()
+    return result
+
+def run_cron_phase(server, keywords, politeness, resolver, args):
+    """GoogleNewsCron.exec: 피드 요청 -> 날짜 파싱 -> DB 저장 -> 본문 채우기"""
+    from google_news_cron import GoogleNewsCron
+
+    session = server.create_session()
+    cron = GoogleNewsCron(max_concurrency=args.concurrency, politeness=politeness, http=session,
+                          resolver=resolver, breaker=DomainCircuitBreaker(), extract_workers=args.extract_workers,
+                          retry_workers=0, enrich_workers=args.enrich_workers, timer=shared_timer,
+                          robots=RobotsCache(session, politeness, default_delay=None))
+    for keyword in keywords:
+        cron.register_keyword('ko', keyword)
+
+    worker_cpu = [0.0]
+
+    def crawl():
+        for keyword in keywords:
+            cron.exec('ko', keyword)
+        # 본문 채우기가 모두 끝날 때까지 대기
+        cron.enricher.shutdown(wait=True)
+        # 추출 프로세스를 측정 안에서 종료 (RUSAGE_CHILDREN은 종료/회수된 자식 프로세스 CPU만 포함)
+        if cron.extractionPool:
+            worker_cpu[0] = get_pool_cpu(cron.extractionPool)
+            cron.extractionPool.shutdown(wait=True)
+        return sum(
+            1 for keyword in keywords
+            for row in cron.dbManager.querySelectAllGoogleNewsTable(keyword)
+            if row['content'] and not cron.retryQueue.is_retryable(row['content'])
+        )
+
+    try:
+        return measure_phase('GoogleNewsCron.exec', len(keywords) * args.articles, crawl, lambda: worker_cpu[0])
+    finally:
+        cron.stop()
+
+def run_direct_phase(server, article_urls, politeness, resolver, args):
+    """DirectContentCrawler.extract_content: 페이지 요청 -> 파싱 -> 추출"""
+    from direct_content_test import DirectContentCrawler
+
+    session = server.create_session()
+    crawler = DirectContentCrawler(politeness=politeness, http=session, resolver=resolver,
+                                   selector_store=AdaptiveSelectorStore('selector_stats.json'),
+                                   breaker=DomainCircuitBreaker(), timer=shared_timer,
+                                   robots=RobotsCache(session, politeness, default_delay=None))
+
+    def crawl():
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            return sum(1 for content in executor.map(crawler.extract_content, article_urls) if content)
+
+    return measure_phase('DirectContentCrawler.extract_content', len(article_urls), crawl)
+
+def run_phase(phase, keywords, article_urls, args):
+    """
+    단계 하나를 재생 서버/요청 간격 스케줄러를 새로 만들어 실행
+    run_isolated_phase가 단계마다 새 프로세스에서 호출하므로 최대 RSS가 앞 단계 값을 물려받지 않음
+    """
+    server = ReplayServer('recordings', latency=args.latency, jitter=args.jitter).start()
+    politeness = DomainPolitenessScheduler(min_interval=args.min_interval, jitter=0)
+    try:
+        if phase == 'cron_exec':
+            return run_cron_phase(server, keywords, politeness, LinkResolver('link_cache_cron.db'), args)
+        return run_direct_phase(server, article_urls, politeness, LinkResolver('link_cache_direct.db'), args)
+    finally:
+        server.stop()
+
+def run_isolated_phase(phase, keywords, article_urls, args):
+    """단계를 별도 프로세스(spawn)에서 실행하고 결과 반환 (peak_rss_mb가 단계별 값이 되도록)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(run_phase, phase, keywords, article_urls, args).result()
+
+def compare_results(previous, current):
+    """이전 결과 대비 처리량/지연 변화 출력"""
+    print("📊 이전 결과와 비교")
+    for phase, item in current['phases'].items():
+        before = previous.get('phases', {}).get(phase)
+        if not before:
+            continue
+        change = (item['articles_per_sec'] / before['articles_per_sec'] - 1) * 100 if before['articles_per_sec'] else 0
+        print(f"   {phase}: {before['articles_per_sec']:.1f} -> {item['articles_per_sec']:.1f}개/초 ({change:+.1f}%)")
+        for stage, stats in item['stages'].items():
+            if stage in before['stages']:
+                print(f"      {stage} p95: {before['stages'][stage]['p95']:.2f} -> {stats['p95']:.2f}ms")
+
+def run_benchmark(args):
+    workdir = args.workdir or tempfile.mkdtemp(prefix='crawl_benchmark_')
+    os.makedirs(workdir, exist_ok=True)
+    output = os.path.abspath(args.output) if args.output else None
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+
+    # DB/캐시 파일이 실제 데이터와 섞이지 않도록 작업 폴더에서 실행
+    os.chdir(workdir)
+    print(f"🧪 크롤링 벤치마크: 키워드 {args.keywords}개 x 기사 {args.articles}개, 작업 폴더 {workdir}")
+
+    from google_news_cron import GoogleNewsCron
+    keywords = [f"bench{k}" for k in range(args.keywords)]
+    feed_urls = {keyword: GoogleNewsCron.build_feed_url('ko', keyword) for keyword in keywords}
+    article_urls = build_corpus(HttpRecorder('recordings'), feed_urls, args.articles, args.hosts)
+
+    # 단계마다 새 프로세스에서 실행 (ru_maxrss는 프로세스 전체 최대값이라 같은 프로세스면 뒤 단계가 앞 단계 값을 물려받음)
+    phases = {phase: run_isolated_phase(phase, keywords, article_urls, args)
+              for phase in ('cron_exec', 'direct_extract')}
+
+    result = {
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'keywords': args.keywords, 'articles': args.articles, 'hosts': args.hosts,
+            'latency': args.latency, 'jitter': args.jitter, 'min_interval': args.min_interval,
+            'concurrency': args.concurrency, 'enrich_workers': args.enrich_workers,
+            'extract_workers': args.extract_workers,
+        },
+        'phases': phases,
+    }
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {output}")
+    if previous:
+        compare_results(previous, result)
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='합성 피드/기사로 크롤링 전 과정 처리량 측정')
+    parser.add_argument('--keywords', type=int, default=5, help='키워드(피드) 수')
+    parser.add_argument('--articles', type=int, default=40, help='피드당 기사 수')
+    parser.add_argument('--hosts', type=int, default=8, help='기사를 나눠 담을 언론사 도메인 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='재생 서버 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='재생 서버 추가 무작위 지연 최대값 (초)')
+    parser.add_argument('--min-interval', type=float, default=0.0, help='같은 도메인 요청 간격 (초)')
+    parser.add_argument('--concurrency', type=int, default=10, help='동시 페이지 요청 수')
+    parser.add_argument('--enrich-workers', type=int, default=2)
+    parser.add_argument('--extract-workers', default=None,
+                        help="추출 프로세스 수 ('auto' 가능, 설정하면 parse/extract 단계는 작업 프로세스에서 측정되지 않음)")
+    parser.add_argument('--workdir', help='DB/캐시를 만들 작업 폴더 (기본값: 임시 폴더)')
+    parser.add_argument('--output', default='crawl_benchmark.json', help='결과 JSON 경로')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+    if args.extract_workers and args.extract_workers != 'auto':
+        args.extract_workers = int(args.extract_workers)
+
+    run_benchmark(args)
@@ -0,0 +1,66 @@
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+class CrawlBudget:
+    """
+    모든 키워드가 함께 쓰는 동시 요청 예산
+    - 동시에 진행되는 피드/기사 요청을 max_concurrent개로 제한
+    - 자리가 없으면 우선순위 대기열에서 기다림 (priority가 큰 요청 먼저, 같으면 먼저 온 순서)
+    """
+    def __init__(self, max_concurrent=10):
+        self.max_concurrent = max_concurrent
+        self.condition = threading.Condition()
+        self.active = 0
+        self.waiting = []
+        self.counter = itertools.count()
+        self.stats = {'acquired': 0, 'waited': 0, 'total_wait': 0.0, 'max_wait': 0.0, 'max_active': 0, 'max_waiting': 0}
+
+    def acquire(self, priority=0):
+        """자리가 날 때까지 대기 후 대기 시간(초) 반환"""
+        started = time.monotonic()
+        with self.condition:
+            entry = (-priority, next(self.counter))
+            heapq.heappush(self.waiting, entry)
+            self.stats['max_waiting'] = max(self.stats['max_waiting'], len(self.waiting))
+            while self.active >= self.max_concurrent or self.waiting[0] != entry:
+                self.condition.wait()
+            heapq.heappop(self.waiting)
+            self.active += 1
+
+            waited = time.monotonic() - started
+            self.stats['acquired'] += 1
+            self.stats['waited'] += 1 if waited > 0.001 else 0
+            self.stats['total_wait'] += waited
+            self.stats['max_wait'] = max(self.stats['max_wait'], waited)
+            self.stats['max_active'] = max(self.stats['max_active'], self.active)
+            # 남은 자리가 있으면 다음 순서도 바로 진행
+            self.condition.notify_all()
+        return waited
+
+    def release(self):
+        with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+
+    @contextmanager
+    def slot(self, priority=0):
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_stats(self):
+        """active: 진행 중인 요청 수, waiting: 대기 중인 요청 수, waited: 기다린 적 있는 요청 수, avg_wait: 평균 대기 초"""
+        with self.condition:
+            stats = dict(self.stats)
+            stats['active'] = self.active
+            stats['waiting'] = len(self.waiting)
+        stats['avg_wait'] = stats['total_wait'] / stats['acquired'] if stats['acquired'] else 0.0
+        return stats
+
+# 모든 크롤러가 공유하는 기본 예산
+shared_budget = CrawlBudget()
@@ -109,6 +109,30 @@ def migrate_data_with_content_column():
     finally:
         conn.close()
 
+def migrate_published_ts():
+    """
+    모든 뉴스 테이블에 published_ts(발행 시각 epoch 초) 컬럼을 추가하고 기존 published 값으로 채움
+    """
+    from google_news_dbmanager import GoogleNewsDBManager
+
+    dbManager = GoogleNewsDBManager()
+    cursor = dbManager.db.cursor()
+    
+    try:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'google_news_%';")
+        tables = [row[0] for row in cursor.fetchall()]
+        
+        for table_name in tables:
+            filled = dbManager.queryMigratePublishedTs(table_name[len('google_news_'):])
+            print(f"   ✅ {table_name}: published_ts {filled}개 채움")
+        
+        print("🎉 마이그레이션 완료!")
+        
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+    finally:
+        dbManager.stop()
+
 def main():
     print("🛠️  Google News 데이터베이스 수정 도구")
     print("=" * 50)
@@ -116,10 +140,11 @@ def main():
     print("\n선택하세요:")
     print("1. 기존 테이블 삭제 후 새로 생성 (추천)")
     print("2. 기존 데이터 유지하며 컬럼 추가 (고급)")
-    print("3. 데이터베이스 백업만")
-    print("4. 취소")
+    print("3. 발행 시각(published_ts) 컬럼 추가 및 채우기")
+    print("4. 데이터베이스 백업만")
+    print("5. 취소")
     
-    choice = input("\n번호를 입력하세요 (1-4): ")
+    choice = input("\n번호를 입력하세요 (1-5): ")
     
     if choice == '1':
         # 백업 먼저
@@ -132,8 +157,12 @@ def main():
         
     elif choice == '3':
         backup_existing_data()
+        migrate_published_ts()
         
     elif choice == '4':
+        backup_existing_data()
+        
+    elif choice == '5':
         print("👋 종료합니다.")
         
     else:
@@ -1,12 +1,53 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import re
 from urllib.parse import urlparse
 
+from politeness_scheduler import shared_scheduler
+from http_session import shared_session
+from link_resolver import get_shared_resolver, is_redirect_host
+from circuit_breaker import shared_breaker
+from html_parser_backend import make_soup
+from selector_matcher import SelectorMatcher
+from selector_stats import get_shared_store
+from stage_timer import shared_timer
+from robots_cache import RobotsCache
+
 class DirectContentCrawler:
-    def __init__(self):
+    # 사이트별 선택자 매핑
+    site_selectors = {
+        'www.hankyung.com': ['.article-body', '.article-content', '.content', '.article_text'],
+        'www.mk.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.etnews.com': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.donga.com': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.chosun.com': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.joongang.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.khan.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.hani.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.ohmynews.com': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.zdnet.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.it.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.inews24.com': ['.article_body', '.article-content', '.content', '.article_text'],
+        'www.m-economynews.com': ['.article_body', '.article-content', '.content', '.article_text'],
+    }
+
+    # 일반 추출 우선순위별 선택자
+    general_selectors = [
+        'article',
+        '.article-body', '.article-content', '.article-text',
+        '.content', '.post-content', '.entry-content',
+        '#article-body', '#content', '#post-content',
+        '.story-body', '.story-content',
+        '.news-content', '.news-body',
+        '.main-content', '.main-text',
+        '.text-content', '.text-body'
+    ]
+
+    # 위 선택자 전체 + p 태그를 한 번에 찾는 매처
+    matcher = SelectorMatcher(list(dict.fromkeys(
+        general_selectors + [selector for selectors in site_selectors.values() for selector in selectors]
+    )))
+
+    def __init__(self, politeness=None, http=None, resolver=None, max_page_bytes=512 * 1024, selector_store=None,
+                 breaker=None, archive=None, timer=None, robots=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
@@ -16,100 +57,147 @@ class DirectContentCrawler:
             'Upgrade-Insecure-Requests': '1',
         }
         
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # 공용 연결 풀 사용 (헤더는 요청마다 전달해 공용 세션을 오염시키지 않음)
+        self.session = http or shared_session
+        # 페이지는 앞부분 max_page_bytes 바이트만 스트리밍으로 읽음
+        self.max_page_bytes = max_page_bytes
+        # 호스트별 요청 간격 스케줄러 (다른 언론사는 병렬, 같은 언론사는 간격 유지)
+        self.politeness = politeness or shared_scheduler
+        # 리다이렉트 링크 -> 언론사 URL 캐시 (사이트별 추출도 실제 도메인 기준)
+        self.resolver = resolver or get_shared_resolver()
+        # 도메인별로 성공한 선택자를 학습해 다음 페이지에서 먼저 시도
+        self.selector_store = selector_store or get_shared_store()
+        # 실패가 반복되는 언론사는 일정 시간 건너뜀 (지수 백오프)
+        self.breaker = breaker or shared_breaker
+        # robots.txt 수집 금지 경로 / Crawl-delay
+        self.robots = robots or RobotsCache(self.session, self.politeness)
+        # (선택) 원본 HTML 압축 보관소
+        self.archive = archive
+        # 단계별 소요 시간 (페이지 요청, 파싱, 추출)
+        self.timer = timer or shared_timer
 
     def extract_content(self, url):
         """웹페이지에서 뉴스 내용 추출"""
         try:
             print(f"내용 추출 시도: {url}")
             
-            time.sleep(random.uniform(1, 2))
+            # 리다이렉트 링크는 직접 따라가 언론사 URL 확인 (robots/브레이커/요청 간격은 언론사 호스트 기준)
+            target = self.resolver.follow(url, self.session, self.politeness, headers=self.headers, timeout=15)
+            host = urlparse(target).netloc.lower()
+            use_breaker = not is_redirect_host(host)
             
-            response = self.session.get(url, timeout=15)
+            # robots.txt는 브레이커보다 먼저 확인 (수집 금지 URL이 시험 요청 자리를 차지하지 않도록)
+            if use_breaker and not self.robots.allowed(target):
+                print(f"robots.txt 수집 금지: {target}")
+                return None
             
-            if response.status_code != 200:
-                print(f"HTTP 오류: {response.status_code}")
+            if use_breaker and not self.breaker.allow(host):
+                print(f"차단 중인 사이트 건너뜀: {host}")
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self.politeness.wait(target)
             
-            # 불필요한 요소 제거
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
-                element.decompose()
+            try:
+                with self.timer.measure('page_fetch'):
+                    response = self.session.get_page(target, max_bytes=self.max_page_bytes, headers=self.headers, timeout=15)
+            except Exception as e:
+                if use_breaker:
+                    self.breaker.record_failure(host, str(e)[:100])
+                raise
+            self.resolver.remember(url, response.url)
             
-            # 사이트별 특화 추출
-            content = self.extract_by_site(url, soup)
-            if content:
-                return content
+            if use_breaker:
+                if self.breaker.is_failure_status(response.status_code):
+                    self.breaker.record_failure(host, f"HTTP {response.status_code}")
+                else:
+                    self.breaker.record_success(host)
             
-            # 일반적인 패턴으로 추출
-            content = self.extract_general(soup)
-            if content:
-                return content
+            if response.status_code != 200:
+                print(f"HTTP 오류: {response.status_code}")
+                return None
             
-            return None
+            if self.archive is not None and response.content:
+                self.archive.store(url, response.content, response.url)
+            
+            return self.extract_from_html(response.url, response.content)
             
         except Exception as e:
             print(f"내용 추출 오류: {e}")
             return None
 
-    def extract_by_site(self, url, soup):
-        """사이트별 특화 추출"""
+    def extract_from_html(self, url, html, parser=None):
+        """이미 받은 HTML에서 내용 추출 (url은 사이트별 선택자 판단용)"""
+        with self.timer.measure('parse'):
+            soup = make_soup(html, parser)
+        with self.timer.measure('extract'):
+            return self.extract_from_soup(url, soup)
+
+    def extract_from_soup(self, url, soup):
+        """파싱된 문서에서 내용 추출"""
+        # 불필요한 요소 제거
+        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
+            element.decompose()
+        
         domain = urlparse(url).netloc.lower()
         
-        # 사이트별 선택자 매핑
-        site_selectors = {
-            'www.hankyung.com': ['.article-body', '.article-content', '.content', '.article_text'],
-            'www.mk.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.etnews.com': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.donga.com': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.chosun.com': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.joongang.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.khan.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.hani.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.ohmynews.com': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.zdnet.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.it.co.kr': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.inews24.com': ['.article_body', '.article-content', '.content', '.article_text'],
-            'www.m-economynews.com': ['.article_body', '.article-content', '.content', '.article_text'],
-        }
+        # 학습된 선택자가 있으면 먼저 시도 (첫 적중에서 바로 멈춤)
+        preferred = self.selector_store.get_preferred(domain)
+        if preferred:
+            content = self.matcher.find_content(soup, preferred, 100)
+            if content:
+                self.selector_store.record_hit(domain, preferred)
+                print(f"학습 선택자 추출 성공 ({domain}, {preferred}): {len(content)}자")
+                return self.clean_content(content)
+            self.selector_store.record_miss(domain, preferred)
+        
+        # 사이트별/일반 선택자와 p 태그를 한 번의 DOM 순회로 수집
+        matches = self.matcher.collect(soup)
         
-        if domain in site_selectors:
-            for selector in site_selectors[domain]:
-                elements = soup.select(selector)
-                for element in elements:
-                    content = element.get_text(strip=True)
-                    if len(content) > 100:
-                        print(f"사이트별 추출 성공 ({domain}): {len(content)}자")
-                        return self.clean_content(content)
+        # 사이트별 특화 추출
+        content = self.extract_by_site(url, soup, matches)
+        if content:
+            return content
+        
+        # 일반적인 패턴으로 추출
+        content = self.extract_general(soup, matches, domain)
+        if content:
+            return content
         
         return None
 
-    def extract_general(self, soup):
-        """일반적인 패턴으로 추출"""
-        # 우선순위별 선택자
-        selectors = [
-            'article',
-            '.article-body', '.article-content', '.article-text',
-            '.content', '.post-content', '.entry-content',
-            '#article-body', '#content', '#post-content',
-            '.story-body', '.story-content',
-            '.news-content', '.news-body',
-            '.main-content', '.main-text',
-            '.text-content', '.text-body'
-        ]
+    def extract_by_site(self, url, soup, matches=None):
+        """사이트별 특화 추출"""
+        domain = urlparse(url).netloc.lower()
         
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                content = element.get_text(strip=True)
-                if len(content) > 100:
-                    print(f"일반 패턴 추출 성공 ({selector}): {len(content)}자")
-                    return self.clean_content(content)
+        if domain in self.site_selectors:
+            if matches is None:
+                matches = self.matcher.collect(soup)
+            selectors = self.selector_store.ordered_selectors(domain, self.site_selectors[domain])
+            selector, content = self.matcher.first_match(matches, 100, selectors=selectors)
+            if content:
+                self.selector_store.record_hit(domain, selector)
+                print(f"사이트별 추출 성공 ({domain}): {len(content)}자")
+                return self.clean_content(content)
+        
+        return None
+
+    def extract_general(self, soup, matches=None, domain=None):
+        """일반적인 패턴으로 추출 (domain을 주면 학습 순서대로 시도하고 결과 기록)"""
+        if matches is None:
+            matches = self.matcher.collect(soup)
+        
+        selectors = self.general_selectors
+        if domain:
+            selectors = self.selector_store.ordered_selectors(domain, selectors)
+        selector, content = self.matcher.first_match(matches, 100, selectors=selectors)
+        if content:
+            if domain:
+                self.selector_store.record_hit(domain, selector)
+            print(f"일반 패턴 추출 성공 ({selector}): {len(content)}자")
+            return self.clean_content(content)
         
         # p 태그 기반 추출
-        paragraphs = soup.find_all('p')
+        paragraphs = matches['p']
         if paragraphs:
             valid_paragraphs = []
             for p in paragraphs:
@@ -120,6 +208,8 @@ class DirectContentCrawler:
             if valid_paragraphs:
                 content = ' '.join(valid_paragraphs)
                 if len(content) > 100:
+                    if domain:
+                        self.selector_store.record_hit(domain, 'p')
                     print(f"p 태그 추출 성공: {len(content)}자")
                     return self.clean_content(content)
         
@@ -151,8 +241,8 @@ class DirectContentCrawler:
         
         return content[:3000]  # 최대 3000자로 제한
 
-def test_direct_crawling():
-    crawler = DirectContentCrawler()
+def test_direct_crawling(crawler=None):
+    crawler = crawler or DirectContentCrawler()
     
     # 실제 뉴스 사이트 URL들 (테스트용)
     test_urls = [
@@ -176,4 +266,18 @@ def test_direct_crawling():
         print("-" * 50)
 
 if __name__ == "__main__":
-    test_direct_crawling() 
\ No newline at end of file
+    import argparse
+    from http_session import PooledHttpSession
+    from http_replay import HttpRecorder, install_replay
+
+    parser = argparse.ArgumentParser(description='직접 뉴스 사이트 크롤링 테스트')
+    parser.add_argument('--record', metavar='DIR', help='받은 응답을 DIR에 기록')
+    parser.add_argument('--replay', metavar='URL', help='재생 서버로 오프라인 실행 (예: http://127.0.0.1:8780)')
+    args = parser.parse_args()
+
+    session = PooledHttpSession()
+    if args.record:
+        session.recorder = HttpRecorder(args.record)
+    if args.replay:
+        install_replay(session, args.replay)
+    test_direct_crawling(DirectContentCrawler(http=session))
\ No newline at end of file
@@ -0,0 +1,25 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+def get_mp_context():
+    """
+    스레드가 도는 프로세스(APScheduler)에서 fork는 위험하므로
+    가능하면 forkserver, 아니면 spawn 사용
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+def create_extraction_pool(workers):
+    """
+    HTML 추출 전용 프로세스 풀 생성
+    - None 또는 0: 풀을 만들지 않음 (기존처럼 다운로드 스레드에서 추출)
+    - 'auto': CPU 코어 수만큼
+    - 정수: 해당 개수만큼 프로세스 생성
+    """
+    if not workers:
+        return None
+    if workers == 'auto':
+        workers = os.cpu_count() or 1
+    print(f"⚙️ 추출 프로세스 풀 시작: {workers}개")
+    return ProcessPoolExecutor(max_workers=int(workers), mp_context=get_mp_context())
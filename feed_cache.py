@@ -0,0 +1,63 @@
+import hashlib
+import re
+import threading
+
+class FeedCache:
+    """
+    RSS 피드 URL별 조건부 요청(Conditional GET) 캐시
+    - ETag / Last-Modified 를 기억해 다음 요청에 If-None-Match / If-Modified-Since 전송
+    - 서버가 304를 주지 않아도 본문 해시가 같으면 '변경 없음'으로 판단
+    """
+    # 매 요청마다 바뀌는 피드 생성 시각은 해시에서 제외
+    volatile_pattern = re.compile(rb'<lastBuildDate>.*?</lastBuildDate>', re.S)
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'not_modified': 0, 'same_hash': 0, 'changed': 0}
+
+    def body_hash(self, content):
+        return hashlib.sha1(self.volatile_pattern.sub(b'', content)).hexdigest()
+
+    def get_headers(self, url):
+        """다음 요청에 붙일 조건부 헤더"""
+        with self.lock:
+            entry = self.entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def is_unchanged(self, url, response):
+        """304 응답이거나 이전과 본문 해시가 같으면 True (캐시는 갱신하지 않음)"""
+        with self.lock:
+            self.stats['requests'] += 1
+            if response.status_code == 304:
+                self.stats['not_modified'] += 1
+                return True
+
+            entry = self.entries.get(url)
+            if response.status_code == 200 and entry and entry['hash'] == self.body_hash(response.content):
+                self.stats['same_hash'] += 1
+                return True
+
+            self.stats['changed'] += 1
+            return False
+
+    def update(self, url, response):
+        """피드를 끝까지 처리한 뒤 호출해 기준값 저장"""
+        if response.status_code != 200:
+            return
+        with self.lock:
+            self.entries[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'hash': self.body_hash(response.content),
+            }
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
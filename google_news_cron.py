@@ -1,119 +1,620 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.jobstores.base import JobLookupError
 import requests
+import calendar
 import datetime
-import maya
-import feedparser
-from bs4 import BeautifulSoup
+import math
+import threading
 import time
-import random
+import feedparser
+from concurrent.futures import Future
+from urllib.parse import urlparse
 
 import google_news_dbmanager
+import keyword_batcher
+from async_fetcher import AsyncContentFetcher
+from politeness_scheduler import shared_scheduler
+from http_session import shared_session
+from feed_cache import FeedCache
+from seen_links import SeenLinks
+from link_resolver import get_shared_resolver, is_redirect_host
+from circuit_breaker import shared_breaker
+from retry_queue import RetryQueue, RetryWorker, PENDING_STATUS
+from content_enricher import ContentEnricher
+from content_extractor import extract_news_result
+from extraction_pool import create_extraction_pool
+from stage_timer import shared_timer
+from robots_cache import RobotsCache
+from adaptive_interval import AdaptiveIntervalPolicy
+from crawl_budget import shared_budget
+from rss_date import parse_rss_date, format_kst
 
 class GoogleNewsCron():
-    def __init__(self):
+    def __init__(self, max_concurrency=10, politeness=None, http=None, resolver=None, max_page_bytes=512 * 1024,
+                 extract_workers=None, breaker=None, retry_workers=1, enrich_workers=2, archive=None,
+                 timer=None, robots=None, interval_policy=None, budget=None, window_margin=3600, feed_workers=10,
+                 seen_links=1000):
         print ('크론 시작')
-        self.scheduler = BackgroundScheduler(job_defaults={'max_instances': 10, 'coalesce': False})
+        # 같은 작업은 한 번에 하나만 실행하고, 밀린 실행은 한 번으로 합침
+        # feed_workers: 동시에 실행하는 피드 수집 작업 수
+        self.scheduler = BackgroundScheduler(executors={'default': ThreadPoolExecutor(feed_workers)},
+                                             job_defaults={'max_instances': 1, 'coalesce': True})
         self.scheduler.start()
         self.dbManager = google_news_dbmanager.GoogleNewsDBManager()
+        # 예약 작업과 마지막 수집 기록 (재시작 후 resume()으로 이어서 수집)
+        self.dbManager.queryCreateCrawlJobTable()
+        # 증분 수집 시 마지막 수집 시각보다 이만큼(초) 더 이전부터 요청 (늦게 색인되는 기사 대비)
+        self.window_margin = window_margin
+        # 호스트별 요청 간격 스케줄러 (기본값: 프로세스 공용 스케줄러)
+        self.politeness = politeness or shared_scheduler
+        # RSS와 기사 본문 요청이 함께 쓰는 연결 풀 (keep-alive 재사용)
+        self.http = http or shared_session
+        # 기사 페이지는 앞부분 max_page_bytes 바이트만 읽음 (None이면 전체)
+        self.max_page_bytes = max_page_bytes
+        # Google News 리다이렉트 링크 -> 언론사 URL 영구 캐시
+        self.resolver = resolver or get_shared_resolver()
+        # 403/429/타임아웃이 반복되는 언론사는 일정 시간 건너뜀
+        self.breaker = breaker or shared_breaker
+        # 언론사 robots.txt (수집 금지 경로 확인, Crawl-delay를 요청 간격에 반영)
+        self.robots = robots or RobotsCache(self.http, self.politeness)
+        # (선택) 원본 HTML 압축 보관소 - 선택자 개선 후 재크롤링 없이 다시 추출할 때 사용
+        self.archive = archive
+        # 단계별 소요 시간 (피드 요청, 날짜 파싱, 페이지 요청, DB 저장)
+        self.timer = timer or shared_timer
+        # adaptive 모드의 피드별 폴링 간격 (새 기사가 많으면 짧게, 없으면 길게)
+        self.intervalPolicy = interval_policy or AdaptiveIntervalPolicy()
+        # 모든 키워드가 함께 쓰는 동시 요청 예산 (우선순위가 높은 키워드 먼저)
+        self.budget = budget or shared_budget
+        self.keywordPriority = {}
+        self.linkPriority = {}
+        # 수집 중인 (국가, 키워드) - 같은 키워드는 한 번에 하나만 수집
+        self.runLock = threading.Lock()
+        self.running = set()
+        # 피드 URL별 ETag/Last-Modified/본문 해시 (변경 없는 피드는 건너뜀)
+        self.feedCache = FeedCache()
+        # 키워드별로 이미 저장한 링크 (DB 조회 결과도 함께 기억, 키워드당 최근 seen_links개까지)
+        self.seenLinks = SeenLinks(seen_links)
+        # HTML 파싱/정리를 맡는 프로세스 풀 (extract_workers가 None이면 다운로드 스레드에서 바로 추출)
+        self.extractionPool = create_extraction_pool(extract_workers)
+        # 기사 본문을 동시에 가져오는 비동기 엔진 (max_concurrency: 전역 동시 요청 수)
+        # 네트워크 대기는 스레드에서, CPU 작업인 추출은 프로세스 풀에서 실행
+        if self.extractionPool:
+            self.fetcher = AsyncContentFetcher(self.download, max_concurrency=max_concurrency,
+                                               extract_func=extract_news_result, extract_executor=self.extractionPool)
+        else:
+            self.fetcher = AsyncContentFetcher(self.get_content, max_concurrency=max_concurrency)
+
+        # 본문 크롤링 실패 기사는 SQLite 대기열에 넣고 백그라운드 작업자가 재시도
+        self.retryQueue = RetryQueue(self.dbManager)
+        self.retryWorker = RetryWorker(self.retryQueue, self.get_content, workers=retry_workers)
+        if retry_workers:
+            self.retryWorker.start()
+        # 메타데이터를 먼저 저장하고 본문은 이 작업자 풀이 나중에 채움
+        self.enricher = ContentEnricher(self.fetcher, self.dbManager, self.retryQueue, workers=enrich_workers)
 
     def __del__(self): 
         self.stop()
 
-    def get_content(self, url):
-        """뉴스 내용 크롤링 함수"""
+    def download(self, url):
+        """
+        네트워크 단계: 기사 페이지 다운로드
+        반환값: (HTML 바이트, None) 또는 실패 시 (None, 상태 문자열)
+        """
         print(f"   📄 내용 크롤링: {url[:50]}...")
+        priority = self.linkPriority.pop(url, 0)
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
+        # Google News 리다이렉트는 직접 따라가 언론사 URL을 확인 (이미 확인한 링크는 요청 없이 캐시 사용)
+        # 리다이렉트 홉은 짧은 간격만 두고, 언론사 요청 간격/robots/브레이커는 언론사 호스트 기준
+        try:
+            target = self.resolver.follow(url, self.http, self.politeness, timeout=10)
+        except Exception as e:
+            print(f"   ❌ 리다이렉트 오류: {str(e)[:30]}")
+            return None, "크롤링 오류"
+        host = urlparse(target).netloc.lower()
+        use_breaker = not is_redirect_host(host)
+
+        # robots.txt는 브레이커보다 먼저 확인 (수집 금지 URL이 시험 요청 자리를 차지하지 않도록)
+        if use_breaker and not self.robots.allowed(target):
+            print(f"   🤖 robots.txt 수집 금지: {target[:50]}...")
+            return None, "수집 금지"
+
+        if use_breaker and not self.breaker.allow(host):
+            print(f"   ⏸️ 차단 중인 언론사 건너뜀: {host}")
+            return None, "접근 보류"
+
         try:
-            time.sleep(random.uniform(1, 2))
-            response = requests.get(url, headers=headers, timeout=10)
+            while True:
+                self.politeness.wait(target)
+                with self.budget.slot(priority):
+                    # 예산 슬롯을 기다리는 동안 같은 호스트 요청이 먼저 나갔으면 슬롯을 돌려주고 차례를 다시 받음
+                    if self.politeness.mark_sent(target):
+                        continue
+                    with self.timer.measure('page_fetch'):
+                        response = self.http.get_page(target, max_bytes=self.max_page_bytes, timeout=10)
+                break
+            self.resolver.remember(url, response.url)
+            
+            if use_breaker:
+                if self.breaker.is_failure_status(response.status_code):
+                    self.breaker.record_failure(host, f"HTTP {response.status_code}")
+                else:
+                    self.breaker.record_success(host)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                selectors = [
-                    '#dic_area',        # 네이버 뉴스
-                    '.article_view',    # 다음 뉴스
-                    '.article-body',    # 일반적인 패턴
-                    '.article_body',    # 변형
-                    'article',          # HTML5 article 태그
-                    '.content',         # 일반적인 content 클래스
-                    '.post-content',    # 블로그 스타일
-                    '.entry-content'    # 워드프레스
-                ]
-                
-                for selector in selectors:
-                    element = soup.select_one(selector)
-                    if element:
-                        content = element.get_text(strip=True)
-                        if len(content) > 100:
-                            print(f"   ✅ 성공! 길이: {len(content)}자")
-                            return content[:1500]
-                
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    content = ' '.join([p.get_text(strip=True) for p in paragraphs])
-                    if len(content) > 100:
-                        print(f"   ✅ p태그로 성공! 길이: {len(content)}자")
-                        return content[:1500]
-                
-                print("   ❌ 내용 추출 실패")
-                return "내용 추출 실패"
-                
-            else:
-                print(f"   ❌ HTTP {response.status_code}")
-                return "접근 실패"
+                if self.archive is not None and response.content:
+                    self.archive.store(url, response.content, response.url)
+                return response.content, None
+            
+            print(f"   ❌ HTTP {response.status_code}")
+            return None, "접근 실패"
                 
         except Exception as e:
+            if use_breaker:
+                self.breaker.record_failure(host, str(e)[:100])
             print(f"   ❌ 오류: {str(e)[:30]}")
-            return "크롤링 오류"
+            return None, "크롤링 오류"
 
-    def exec(self, country, keyword):
-        print ('Google News Cron Start: ' + datetime.datetime.now().strftime("%m/%d/%Y, %H:%M:%S"))
-        URL = 'https://news.google.com/rss/search?q={}+when:1d'.format(keyword)
+    def get_content(self, url):
+        """뉴스 내용 크롤링 함수 (다운로드 + 추출을 현재 스레드에서 실행)"""
+        return extract_news_result(self.download(url))
+
+    def filter_new_entries(self, keyword, datas):
+        """이미 저장된 링크를 걸러내고 새 기사만 반환 (메모리 캐시 + DB 일괄 조회)"""
+        candidates = []
+        batch_links = set()
+        for data in datas:
+            if data.link in batch_links or self.seenLinks.contains(keyword, data.link):
+                continue
+            batch_links.add(data.link)
+            candidates.append(data)
+
+        existing = self.dbManager.querySelectExistingLinks(keyword, batch_links)
+        self.seenLinks.add(keyword, existing)
+        return [data for data in candidates if data.link not in existing]
+
+    @staticmethod
+    def build_feed_url(country, query, window='1d'):
+        URL = 'https://news.google.com/rss/search?q={}+when:{}'.format(query, window)
         if country == 'en':
             URL += '&hl=en-NG&gl=NG&ceid=NG:en'
         elif country == 'ko':
             URL += '&hl=ko&gl=KR&ceid=KR:ko'
+        return URL
+
+    def fetch_feed(self, URL, priority=0):
+        """RSS 요청 - (변경된 피드면 응답, 변경 없음/오류면 None), 변경 없음 여부"""
+        with self.budget.slot(priority), self.timer.measure('feed_fetch'):
+            res = self.http.get(URL, headers=self.feedCache.get_headers(URL), timeout=10)
+        if self.feedCache.is_unchanged(URL, res):
+            print('📭 피드 변경 없음 - 건너뜀')
+            return None, True
+
+        if res.status_code != 200:
+            print (f'Google 검색 에러: HTTP {res.status_code}')
+            return None, False
+        return res, False
+
+    def ingest_entries(self, routed):
+        """
+        {키워드: 엔트리 목록}을 2단계로 저장
+        - 1단계: 키워드별 새 기사의 제목/출처/날짜/링크를 바로 저장
+        - 2단계: 본문은 링크당 한 번만 본문 작업자 풀에서 크롤링해 나중에 채움
+        반환값: (키워드별 새 기사 수 합계, 본문 채우기가 끝나면 완료되는 Future - 새 기사가 없으면 None)
+        """
+        new_by_keyword = {}
+        unique = {}
+        for keyword, entries in routed.items():
+            datas = self.filter_new_entries(keyword, entries)
+            print(f"📰 [{keyword}] 총 {len(entries)}개 뉴스 발견 (새 뉴스 {len(datas)}개)")
+            new_by_keyword[keyword] = datas
+            for data in datas:
+                unique.setdefault(data.link, data)
+
+        datas = list(unique.values())
+        for i, data in enumerate(datas):
+            print(f"처리 중: {i+1}/{len(datas)} - {data.title}")
+            with self.timer.measure('date_parse'):
+                published_ts = parse_rss_date(data.get('published'))
+                if published_ts is None and data.get('published_parsed'):
+                    published_ts = calendar.timegm(data.published_parsed)
+                data['published_ts'] = published_ts
+                data['published'] = format_kst(published_ts) if published_ts is not None else data.get('published', '')
+            data['source'] = data.source.title
+            data['content'] = ''
+
+        # 1단계: 메타데이터 저장 (본문은 비워 두고, 중단돼도 재시도 작업자가 이어받도록 대기열에 등록)
+        targets = {}
+        for keyword, keyword_datas in new_by_keyword.items():
+            for data in keyword_datas:
+                with self.timer.measure('db_insert'):
+                    self.dbManager.queryInsertGoogleNewsTable(data, keyword)
+                self.seenLinks.add(keyword, [data.link])
+                self.retryQueue.enqueue(keyword, data.link, PENDING_STATUS, delay=self.enricher.pending_grace)
+                targets.setdefault(data.link, []).append(keyword)
+                # 여러 키워드에 걸린 기사는 가장 높은 우선순위로 요청
+                self.linkPriority[data.link] = max(self.linkPriority.get(data.link, 0), self.get_priority(keyword))
+
+        # 2단계: 본문 채우기는 별도 작업자 풀에서
+        new_count = sum(len(keyword_datas) for keyword_datas in new_by_keyword.values())
+        if not targets:
+            return new_count, None
+        return new_count, self.enricher.submit(targets)
+
+    def get_priority(self, keyword):
+        return self.keywordPriority.get(keyword.lower(), 0)
+
+    def begin_run(self, country, keywords):
+        """키워드들의 수집 시작 표시 (이미 수집 중인 키워드가 있으면 None)"""
+        keys = {(country, keyword.lower()) for keyword in keywords}
+        with self.runLock:
+            if keys & self.running:
+                return None
+            self.running |= keys
+        return keys
+
+    def end_run(self, keys):
+        with self.runLock:
+            self.running -= keys
+
+    def exec(self, country, keyword):
+        """키워드 피드 한 번 수집 (반환값: 새 기사 수, 요청 오류거나 이전 수집이 진행 중이면 None)"""
+        keys = self.begin_run(country, [keyword])
+        if keys is None:
+            print(f"⏭️ [{keyword}] 이전 수집이 아직 진행 중 - 건너뜀")
+            return None
+        try:
+            new_count, _ = self._exec(country, keyword)
+            return new_count
+        finally:
+            self.end_run(keys)
+
+    def _exec(self, country, keyword):
+        """피드 수집 (반환값: (새 기사 수 - 요청 오류/오류 응답이면 None, 본문 채우기 Future 목록))"""
+        print ('Google News Cron Start: ' + datetime.datetime.now().strftime("%m/%d/%Y, %H:%M:%S"))
+        job_id = self.get_job_id(country, [keyword])
+        URL = self.build_feed_url(country, keyword, self.get_feed_window(job_id))
 
         try: 
-            res = requests.get(URL)
-            if res.status_code == 200:
-                datas = feedparser.parse(res.text).entries
-                print(f"📰 총 {len(datas)}개 뉴스 발견")
-                
-                for i, data in enumerate(datas):
-                    print(f"처리 중: {i+1}/{len(datas)} - {data.title}")
-                    data['published'] = maya.parse(data.published).datetime(to_timezone="Asia/Seoul", naive=True) 
-                    data['source'] = data.source.title
-                    data['content'] = self.get_content(data.link)
-                    self.dbManager.queryInsertGoogleNewsTable(data)
-            else:
-                print ('Google 검색 에러')
+            started = int(time.time())
+            res, unchanged = self.fetch_feed(URL, self.get_priority(keyword))
+            if unchanged:
+                # 변경 없는 피드도 수집한 것으로 기록 (범위가 늘어나 URL/캐시가 바뀌지 않도록)
+                self.record_run(job_id, country, [keyword], started, [])
+                return 0, []
+            if res is None:
+                # 429 등 오류 응답은 새 기사 0개와 구분 (폴링 간격을 늘리지 않고 상태를 error로)
+                return None, []
+
+            entries = feedparser.parse(res.text).entries
+            new_count, future = self.ingest_entries({keyword: entries})
+            self.feedCache.update(URL, res)
+            self.record_run(job_id, country, [keyword], started, entries)
+            return new_count, [future] if future else []
         except requests.exceptions.RequestException as err:
             print ('Error Requests: {}'.format(err))
+            return None, []
+
+    def exec_batch(self, country, keywords):
+        """
+        같은 국가 키워드들을 OR 검색어로 묶어 요청하고, 결과를 키워드별로 분배
+        반환값: 새 기사 수 합계 (모든 요청이 실패했거나 이전 수집이 진행 중이면 None)
+        """
+        keys = self.begin_run(country, keywords)
+        if keys is None:
+            print(f"⏭️ [{', '.join(keywords)}] 이전 수집이 아직 진행 중 - 건너뜀")
+            return None
+        try:
+            total, _ = self._exec_batch(country, keywords)
+            return total
+        finally:
+            self.end_run(keys)
+
+    def _exec_batch(self, country, keywords):
+        """묶음 피드 수집 (반환값: (새 기사 수 합계 - 모두 실패하면 None, 본문 채우기 Future 목록))"""
+        print ('Google News Batch Start: ' + datetime.datetime.now().strftime("%m/%d/%Y, %H:%M:%S"))
+        batches = keyword_batcher.batch_keywords(keywords)
+        print(f"🔎 키워드 {len(keywords)}개 -> RSS 요청 {len(batches)}회")
+
+        job_id = self.get_job_id(country, keywords)
+        window = self.get_feed_window(job_id)
+        started = int(time.time())
+        fetched = []
+        futures = []
+
+        total = None
+        failed = False
+        pending = list(batches)
+        while pending:
+            batch = pending.pop(0)
+            URL = self.build_feed_url(country, keyword_batcher.build_or_query(batch), window)
+            try:
+                res, unchanged = self.fetch_feed(URL, max(self.get_priority(keyword) for keyword in batch))
+                if res is None:
+                    if unchanged:
+                        total = total or 0
+                    else:
+                        failed = True
+                    continue
+
+                entries = feedparser.parse(res.text).entries
+                routed, unmatched = keyword_batcher.route_entries(entries, batch)
+                if unmatched:
+                    print(f"   ℹ️ 제목/요약에 키워드가 없어 제외된 뉴스 {unmatched}개")
+                new_count, future = self.ingest_entries(routed)
+                total = (total or 0) + new_count
+                if future:
+                    futures.append(future)
+                self.feedCache.update(URL, res)
+                fetched.append(entries)
+
+                # 반환 한도까지 찬 묶음은 잘렸을 수 있으므로 나눠서 다시 요청
+                halves = keyword_batcher.split_batch(batch) if keyword_batcher.is_full_feed(entries) else []
+                if halves:
+                    print(f"   ✂️ 피드가 {len(entries)}개로 가득 참 - 키워드 {len(batch)}개 묶음을 나눠 다시 요청")
+                    pending.extend(halves)
+            except requests.exceptions.RequestException as err:
+                failed = True
+                print ('Error Requests: {}'.format(err))
+
+        # 모든 묶음을 받아 온(또는 변경 없음을 확인한) 경우에만 기록 (일부가 빠지면 다음에도 같은 범위로 요청)
+        if not failed:
+            self.record_run(job_id, country, keywords, started, [entry for entries in fetched for entry in entries])
+        return total, futures
+
+    def crawl(self, country, keywords, future):
+        """
+        once 모드 작업: 피드 수집 후 본문 채우기까지 끝나면 future에 실행 통계를 넣음
+        (본문 채우기를 기다리는 동안 스케줄러 스레드를 붙잡지 않음)
+        """
+        if not future.set_running_or_notify_cancel():
+            return
+
+        started = time.monotonic()
+        stats = {
+            'country': country,
+            'keywords': list(keywords),
+            'status': 'ok',
+            'new_articles': 0,
+            'filled': 0,
+            'failed': 0,
+            'feed_error': False,
+            'elapsed': 0.0,
+        }
+        try:
+            keys = self.begin_run(country, keywords)
+            if keys is None:
+                stats['status'] = 'skipped'
+                futures = []
+            else:
+                try:
+                    if len(keywords) == 1:
+                        new_count, futures = self._exec(country, keywords[0])
+                    else:
+                        new_count, futures = self._exec_batch(country, keywords)
+                finally:
+                    self.end_run(keys)
+                stats['status'] = 'ok' if new_count is not None else 'error'
+                stats['feed_error'] = new_count is None
+                stats['new_articles'] = new_count or 0
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        def finish():
+            stats['elapsed'] = time.monotonic() - started
+            future.set_result(stats)
+
+        def on_enriched(enrich_future):
+            with lock:
+                if enrich_future.cancelled():
+                    stats['status'] = 'error'
+                else:
+                    try:
+                        result = enrich_future.result()
+                        stats['filled'] += result['filled']
+                        stats['failed'] += result['failed']
+                    except Exception as e:
+                        print(f"본문 채우기 오류: {e}")
+                        stats['status'] = 'error'
+                pending[0] -= 1
+                done = pending[0] == 0
+            if done:
+                finish()
+
+        if not futures:
+            finish()
+        for enrich_future in futures:
+            enrich_future.add_done_callback(on_enriched)
+
+    @staticmethod
+    def get_job_id(country, keywords):
+        return f"{country}:{','.join(keywords)}"
+
+    def get_feed_window(self, job_id):
+        """
+        증분 수집 범위 (Google News 검색의 when: 값)
+        마지막 수집(변경 없음 포함) 이후 + 여유 시간, 24시간 이상이면 1d
+        (같은 주기로 폴링하면 범위가 일정해 피드 URL과 ETag/해시 캐시가 유지됨)
+        """
+        job = self.dbManager.querySelectCrawlJob(job_id)
+        if job is None or not job['last_run_at']:
+            return '1d'
+
+        hours = math.ceil((time.time() - job['last_run_at'] + self.window_margin) / 3600)
+        return '1d' if hours >= 24 else f'{max(1, hours)}h'
+
+    def record_run(self, job_id, country, keywords, started, entries):
+        """수집 성공 기록 (시작 시각, 이번 피드의 가장 최근 발행 시각)"""
+        published = [calendar.timegm(entry.published_parsed) for entry in entries if entry.get('published_parsed')]
+        self.dbManager.queryUpdateCrawlJobRun(job_id, country, keywords, started, max(published) if published else None)
     
-    def run(self, mode, country, keyword):
-        print ("실행!")
+    def register_keyword(self, country, keyword, priority=0):
+        """키워드 등록 (priority가 클수록 요청 예산을 먼저 받음)"""
+        self.keywordPriority[keyword.lower()] = priority
         self.dbManager.queryCreateGoogleNewsTable(keyword)
         self.dbManager.queryCreateKeywordTable()
         self.dbManager.queryInsertKeywordTable({
             'keyword': keyword,
             'country': country
         })
+        self.retryQueue.enqueue_failed_rows(keyword)
+
+    def run(self, mode, country, keyword, priority=0):
+        """
+        키워드 수집 예약
+        반환값: once 모드면 본문 채우기까지 끝났을 때 완료되는 Future
+                (result(): country, keywords, status, new_articles, filled, failed, elapsed)
+                반복 모드면 None
+        """
+        print ("실행!")
+        self.register_keyword(country, keyword, priority)
+        return self.schedule(mode, country, [keyword], self.exec, [country, keyword])
+
+    def run_batch(self, mode, keywords, priorities=None):
+        """
+        여러 키워드를 국가별로 묶어 실행
+        keywords: [(키워드, 국가), ...]
+        priorities: {키워드: 우선순위} (없으면 0)
+        반환값: once 모드면 국가별 Future 목록 (run()과 같은 실행 통계), 반복 모드면 빈 목록
+        """
+        print ("일괄 실행!")
+        priorities = priorities or {}
+        for keyword, country in keywords:
+            self.register_keyword(country, keyword, priorities.get(keyword, 0))
+
+        futures = []
+        for country, country_keywords in keyword_batcher.group_by_country(keywords).items():
+            future = self.schedule(mode, country, country_keywords, self.exec_batch, [country, country_keywords])
+            if future is not None:
+                futures.append(future)
+        return futures
+
+    def schedule(self, mode, country, keywords, func, args, run_now=False):
+        """
+        모드별 작업 등록 (반복 작업은 피드별 id로 하나만 유지하고 crawl_job 테이블에 저장)
+        run_now: 반복 작업도 첫 실행을 바로 시작
+        """
+        job_id = self.get_job_id(country, keywords)
+        next_run_time = {'next_run_time': datetime.datetime.now()} if run_now else {}
         if mode == 'once':
-            self.scheduler.add_job(self.exec, args=[country, keyword])
+            future = Future()
+            self.scheduler.add_job(self.crawl, args=[country, keywords, future])
+            return future
         elif mode == 'interval':
-            self.scheduler.add_job(self.exec, 'interval', seconds=10, args=[country, keyword])
+            interval = 10
+            self.scheduler.add_job(func, 'interval', seconds=interval, id=job_id, replace_existing=True, args=args,
+                                   **next_run_time)
         elif mode == 'cron':
-            self.scheduler.add_job(self.exec, 'cron', second='*/10', args=[country, keyword])
+            interval = 10
+            self.scheduler.add_job(func, 'cron', second='*/10', id=job_id, replace_existing=True, args=args,
+                                   **next_run_time)
+        elif mode == 'adaptive':
+            interval = self.add_adaptive_job(job_id, func, args)
+        else:
+            return
+
+        priority = max(self.get_priority(keyword) for keyword in keywords)
+        self.dbManager.queryUpsertCrawlJob(job_id, country, keywords, mode, interval, priority)
+
+    def resume(self):
+        """
+        crawl_job 테이블에 저장된 반복 작업을 다시 예약 (재시작 후 바로 이어서 증분 수집)
+        반환값: 다시 예약한 작업 수
+        """
+        jobs = [job for job in self.dbManager.querySelectAllCrawlJobs() if job['mode'] != 'once']
+        for job in jobs:
+            country = job['country']
+            keywords = job['keywords'].split(',')
+            for keyword in keywords:
+                self.register_keyword(country, keyword, job['priority'] or 0)
+            if job['mode'] == 'adaptive' and job['interval']:
+                self.intervalPolicy.set_interval(job['job_id'], job['interval'])
+
+            if len(keywords) == 1:
+                self.schedule(job['mode'], country, keywords, self.exec, [country, keywords[0]], run_now=True)
+            else:
+                self.schedule(job['mode'], country, keywords, self.exec_batch, [country, keywords], run_now=True)
+            print(f"♻️ 작업 재개: {job['job_id']} ({job['mode']}, 다음 범위 when:{self.get_feed_window(job['job_id'])})")
+        return len(jobs)
+
+    def add_adaptive_job(self, job_id, func, args):
+        """adaptive 모드 작업 등록 (바로 한 번 실행한 뒤 정책이 정한 간격으로 반복)"""
+        interval = self.intervalPolicy.get_interval(job_id)
+        self.scheduler.add_job(self.exec_adaptive, 'interval', seconds=interval, id=job_id, replace_existing=True,
+                               next_run_time=datetime.datetime.now(), args=[job_id, func, args])
+        return interval
 
-    def stop(self):
-        try: self.scheduler.shutdown() 
+    def exec_adaptive(self, job_id, func, args):
+        """수집 후 새 기사 수에 따라 다음 폴링 간격 조정"""
+        new_count = func(*args)
+        if new_count is None:
+            return
+
+        before = self.intervalPolicy.get_interval(job_id)
+        interval = self.intervalPolicy.record(job_id, new_count)
+        if interval != before:
+            print(f"⏲️ [{job_id}] 새 뉴스 {new_count}개 -> 폴링 간격 {before:.1f}초 -> {interval:.1f}초")
+            try:
+                self.scheduler.reschedule_job(job_id, trigger='interval', seconds=interval)
+            except JobLookupError:
+                pass
+            self.dbManager.queryUpdateCrawlJobInterval(job_id, interval)
+
+    def get_crawl_stats(self):
+        """크롤링 관련 통계 모음 (요청 간격 / 연결 풀 / 다운로드 바이트 / 리다이렉트 캐시 / RSS 캐시 / 서킷 브레이커)"""
+        return {
+            'politeness': self.politeness.get_stats(),
+            'connections': self.http.get_stats(),
+            'bytes': self.http.get_byte_stats(),
+            'resolver': self.resolver.get_stats(),
+            'feed_cache': self.feedCache.get_stats(),
+            'seen_links': self.seenLinks.get_stats(),
+            'circuit_breaker': self.breaker.get_stats(),
+            'robots': self.robots.get_stats(),
+            'retry': dict(self.retryQueue.get_stats(), **self.retryWorker.get_stats()),
+            'enrichment': self.enricher.get_stats(),
+            'archive': self.archive.get_stats() if self.archive is not None else None,
+            'polling': self.intervalPolicy.get_stats(),
+            'budget': self.budget.get_stats(),
+        }
+
+    def print_crawl_stats(self):
+        self.politeness.print_stats()
+        self.http.print_stats()
+        print(f"🔗 리다이렉트 캐시: {self.resolver.get_stats()}")
+        print(f"📭 RSS 캐시: {self.feedCache.get_stats()}")
+        robots_stats = self.robots.get_stats()
+        print(f"🤖 robots.txt: 호스트 {len(robots_stats['hosts'])}개, 허용 {robots_stats['allowed']}회, "
+              f"금지 {robots_stats['disallowed']}회, 읽기 실패 {robots_stats['errors']}회")
+        print(f"🧩 본문 채우기: {self.enricher.get_stats()}")
+        print(f"🎫 요청 예산: {self.budget.get_stats()}")
+        print(f"🔁 재시도 대기열: {self.retryQueue.get_stats()} / 작업자: {self.retryWorker.get_stats()}")
+        if self.archive is not None:
+            print(f"🗄️ HTML 아카이브: {self.archive.get_stats()}")
+        breaker_stats = self.breaker.get_stats()
+        if breaker_stats:
+            print("🚧 서킷 브레이커")
+            for host, item in sorted(breaker_stats.items()):
+                print(f"   {host}: {item['state']} (연속 실패 {item['failures']}회, 차단 {item['trips']}회, "
+                      f"건너뜀 {item['skipped']}회, 재시도까지 {item['retry_in']:.0f}초)")
+
+    def stop(self, wait=True):
+        """wait=False: 진행 중인 수집을 기다리지 않고 종료 (진행 중인 작업이 쓰는 DB는 닫지 않음)"""
+        try: self.scheduler.shutdown(wait=wait) 
+        except: pass
+        try: self.enricher.shutdown(wait=wait)
+        except: pass
+        try: self.retryWorker.stop()
+        except: pass
+        try: self.fetcher.shutdown(wait=wait)
+        except: pass
+        try: self.extractionPool and self.extractionPool.shutdown()
+        except: pass
+        try: self.archive and self.archive.stop()
         except: pass
-        try: self.dbManager.close() 
+        try: wait and self.dbManager.close() 
         except: pass
@@ -1,5 +1,12 @@
 # improved_google_news_dbmanager.py
 import sqlite3
+import threading
+
+from rss_date import KST_OFFSET
+
+def escape_quotes(value):
+    """뉴스 테이블에 저장하는 값의 따옴표 처리 (저장된 값과 비교할 때도 같은 처리를 거쳐야 일치)"""
+    return str(value).replace('"', "'").replace("'", "''")
 
 class GoogleNewsDBManager:
     def __init__(self):
@@ -7,8 +14,12 @@ class GoogleNewsDBManager:
         self.DBName = 'google_news.db'
         self.db = sqlite3.connect(self.DBName, check_same_thread=False)
         self.db.row_factory = sqlite3.Row
+        # 크롤링 스레드와 재시도 워커가 같은 연결을 쓰므로 쓰기 작업은 잠금 후 실행
+        self.lock = threading.RLock()
         self.google_news_table = 'google_news'
         self.keyword_table = 'keyword'
+        self.retry_table = 'retry_queue'
+        self.crawl_job_table = 'crawl_job'
         
         # 🔥 개선점: content 컬럼 추가
         self.google_news_columns = {
@@ -16,13 +27,36 @@ class GoogleNewsDBManager:
             'source': 'text',
             'title': 'text',
             'link': 'text PRIMARY KEY',  # link를 PRIMARY KEY로 변경 (중복 방지)
-            'content': 'text'  # 📝 뉴스 내용 저장용 컬럼 추가
+            'content': 'text',  # 📝 뉴스 내용 저장용 컬럼 추가
+            'published_ts': 'integer'  # 발행 시각 epoch 초 (정렬/기간 조회용, published는 한국 시간 문자열)
         }
         
         self.keyword_columns = {
             'keyword': 'text PRIMARY KEY',
             'country': 'text',
         }
+        
+        # 본문 크롤링 실패 기사 재시도 대기열
+        self.retry_columns = {
+            'link': 'text',
+            'keyword': 'text',
+            'attempts': 'integer',
+            'next_attempt_at': 'integer',  # 다음 시도 시각 (epoch 초, NULL이면 포기)
+            'last_status': 'text',
+            'PRIMARY KEY': '(link, keyword)',
+        }
+        
+        # 예약된 수집 작업 (재시작 후 이어서 수집)
+        self.crawl_job_columns = {
+            'job_id': 'text PRIMARY KEY',   # 국가:키워드 (일괄 실행은 국가:키워드1,키워드2)
+            'country': 'text',
+            'keywords': 'text',             # 쉼표로 구분
+            'mode': 'text',                 # once / interval / cron / adaptive
+            'interval': 'real',             # 폴링 간격 (초)
+            'priority': 'integer',
+            'last_run_at': 'integer',       # 마지막 수집 성공 시각 (epoch 초)
+            'last_published': 'integer',    # 마지막으로 본 가장 최근 발행 시각 (epoch 초)
+        }
 
     def __del__(self):
         self.stop()
@@ -47,11 +81,35 @@ class GoogleNewsDBManager:
         cursor.execute(query)
         self.db.commit()
         print(f"테이블 생성 완료: {self.google_news_table}")
+        self.queryMigratePublishedTs(keyword)
+
+    def queryMigratePublishedTs(self, keyword):
+        """
+        예전 테이블에 published_ts 컬럼/인덱스를 추가하고 비어 있는 값을 published(한국 시간)로 채움
+        반환값: 채운 행 수
+        """
+        google_news_table = 'google_news_' + keyword.lower()
+        cursor = self.db.cursor()
+        with self.lock:
+            cursor.execute(f"PRAGMA table_info({google_news_table})")
+            if 'published_ts' not in [row[1] for row in cursor.fetchall()]:
+                cursor.execute(f"ALTER TABLE {google_news_table} ADD COLUMN published_ts integer")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {google_news_table}_published_ts ON {google_news_table} (published_ts)")
+            cursor.execute(f"""
+            UPDATE {google_news_table}
+            SET published_ts = CAST(strftime('%s', published) AS integer) - {KST_OFFSET}
+            WHERE (published_ts IS NULL OR published_ts = '') AND strftime('%s', published) IS NOT NULL
+            """)
+            filled = cursor.rowcount
+            self.db.commit()
+        return filled
 
-    def queryInsertGoogleNewsTable(self, values):
+    def queryInsertGoogleNewsTable(self, values, keyword=None):
         """
         뉴스 데이터를 데이터베이스에 삽입
+        keyword를 주면 해당 키워드 테이블에, 없으면 마지막으로 생성한 테이블에 저장
         """
+        google_news_table = 'google_news_' + keyword.lower() if keyword else self.google_news_table
         cursor = self.db.cursor()
         
         # 컬럼명들을 문자열로 조합
@@ -63,22 +121,43 @@ class GoogleNewsDBManager:
         # 각 컬럼에 해당하는 값들을 순서대로 추출
         values_list = []
         for col_name in self.google_news_columns.keys():
-            if col_name in values:
+            if col_name in values and values[col_name] is None:
+                values_list.append(None)
+            elif col_name in values:
                 # 문자열에서 따옴표 문제 해결
-                value = str(values[col_name]).replace('"', "'").replace("'", "''")
-                values_list.append(value)
+                values_list.append(escape_quotes(values[col_name]))
             else:
                 values_list.append("")  # 값이 없으면 빈 문자열
         
-        query = f'INSERT OR REPLACE INTO {self.google_news_table} ({columns}) VALUES ({placeholders})'
+        query = f'INSERT OR REPLACE INTO {google_news_table} ({columns}) VALUES ({placeholders})'
         
         try:
-            cursor.execute(query, values_list)
-            self.db.commit()
+            with self.lock:
+                cursor.execute(query, values_list)
+                self.db.commit()
             print(f"데이터 저장 완료: {values.get('title', 'Unknown')[:50]}...")
         except Exception as e:
             print(f"데이터 저장 오류: {e}")
 
+    def querySelectExistingLinks(self, keyword, links):
+        """
+        links 중 이미 저장된 링크만 set으로 반환 (크롤링 전 중복 제거용)
+        """
+        google_news_table = 'google_news_' + keyword.lower()
+        links = list(links)
+        existing = set()
+        cursor = self.db.cursor()
+
+        # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+        chunk_size = 900
+        for start in range(0, len(links), chunk_size):
+            chunk = links[start:start + chunk_size]
+            placeholders = ','.join(['?' for _ in chunk])
+            cursor.execute(f"SELECT link FROM {google_news_table} WHERE link IN ({placeholders})", chunk)
+            existing.update(row[0] for row in cursor.fetchall())
+
+        return existing
+
     def querySelectAllGoogleNewsTable(self, keyword):
         """
         특정 키워드의 모든 뉴스 조회
@@ -149,6 +228,156 @@ class GoogleNewsDBManager:
             'success_rate': (content_count / total_count * 100) if total_count > 0 else 0
         }
 
+    def queryUpdateGoogleNewsContent(self, keyword, link, content):
+        """
+        이미 저장된 뉴스의 content만 갱신 (재시도 성공 시)
+        """
+        google_news_table = 'google_news_' + keyword.lower()
+        # queryInsertGoogleNewsTable과 같은 방식으로 따옴표 처리
+        content = escape_quotes(content)
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(f"UPDATE {google_news_table} SET content = ? WHERE link = ?", (content, link))
+            self.db.commit()
+            return cursor.rowcount
+
+    def querySelectLinksByContent(self, keyword, contents):
+        """
+        content가 contents 중 하나인 뉴스 링크 조회 (실패 상태 기사 찾기용)
+        """
+        google_news_table = 'google_news_' + keyword.lower()
+        placeholders = ','.join(['?' for _ in contents])
+        cursor = self.db.cursor()
+        cursor.execute(f"SELECT link, content FROM {google_news_table} WHERE content IN ({placeholders})", list(contents))
+        return cursor.fetchall()
+
+    # 재시도 대기열 관련 메서드들
+    def queryCreateRetryQueueTable(self):
+        colum_info = ",".join(col_name + ' ' + col_type for col_name, col_type in self.retry_columns.items())
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {self.retry_table} ({colum_info})")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.retry_table}_next ON {self.retry_table} (next_attempt_at)")
+            self.db.commit()
+
+    def queryEnqueueRetry(self, keyword, link, status, next_attempt_at):
+        """
+        재시도 대기열에 추가 (이미 있으면 그대로 둠)
+        """
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(
+                f"INSERT OR IGNORE INTO {self.retry_table} (link, keyword, attempts, next_attempt_at, last_status) "
+                f"VALUES (?, ?, 0, ?, ?)",
+                (link, keyword, next_attempt_at, status)
+            )
+            self.db.commit()
+            return cursor.rowcount
+
+    def querySelectDueRetries(self, now, limit=20):
+        """
+        시도할 시각이 된 재시도 항목 조회
+        """
+        cursor = self.db.cursor()
+        cursor.execute(
+            f"SELECT * FROM {self.retry_table} WHERE next_attempt_at IS NOT NULL AND next_attempt_at <= ? "
+            f"ORDER BY next_attempt_at LIMIT ?",
+            (now, limit)
+        )
+        return cursor.fetchall()
+
+    def queryUpdateRetry(self, keyword, link, attempts, next_attempt_at, status):
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(
+                f"UPDATE {self.retry_table} SET attempts = ?, next_attempt_at = ?, last_status = ? "
+                f"WHERE link = ? AND keyword = ?",
+                (attempts, next_attempt_at, status, link, keyword)
+            )
+            self.db.commit()
+
+    def queryDeleteRetry(self, keyword, link):
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(f"DELETE FROM {self.retry_table} WHERE link = ? AND keyword = ?", (link, keyword))
+            self.db.commit()
+
+    def queryGetRetryStats(self):
+        """
+        재시도 대기열 현황 (대기 중 / 포기)
+        """
+        cursor = self.db.cursor()
+        cursor.execute(f"""
+        SELECT
+            SUM(CASE WHEN next_attempt_at IS NOT NULL THEN 1 ELSE 0 END),
+            SUM(CASE WHEN next_attempt_at IS NULL THEN 1 ELSE 0 END)
+        FROM {self.retry_table}
+        """)
+        pending, given_up = cursor.fetchone()
+        return {'pending': pending or 0, 'given_up': given_up or 0}
+
+    def queryCreateCrawlJobTable(self):
+        colum_info = ",".join(col_name + ' ' + col_type for col_name, col_type in self.crawl_job_columns.items())
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {self.crawl_job_table} ({colum_info})")
+            self.db.commit()
+
+    def queryUpsertCrawlJob(self, job_id, country, keywords, mode, interval, priority):
+        """
+        수집 작업 등록 (이미 있으면 실행 방식만 갱신하고 마지막 수집 기록은 유지)
+        """
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(
+                f"INSERT INTO {self.crawl_job_table} (job_id, country, keywords, mode, interval, priority) "
+                f"VALUES (?, ?, ?, ?, ?, ?) "
+                f"ON CONFLICT(job_id) DO UPDATE SET mode = excluded.mode, interval = excluded.interval, "
+                f"priority = excluded.priority",
+                (job_id, country, ','.join(keywords), mode, interval, priority)
+            )
+            self.db.commit()
+
+    def queryUpdateCrawlJobInterval(self, job_id, interval):
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(f"UPDATE {self.crawl_job_table} SET interval = ? WHERE job_id = ?", (interval, job_id))
+            self.db.commit()
+
+    def queryUpdateCrawlJobRun(self, job_id, country, keywords, last_run_at, last_published):
+        """
+        수집 성공 기록 (작업이 없으면 once 작업으로 추가, 발행 시각은 더 최근일 때만 갱신)
+        """
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(
+                f"INSERT OR IGNORE INTO {self.crawl_job_table} (job_id, country, keywords, mode, priority) "
+                f"VALUES (?, ?, ?, 'once', 0)",
+                (job_id, country, ','.join(keywords))
+            )
+            cursor.execute(
+                f"UPDATE {self.crawl_job_table} SET last_run_at = ?, "
+                f"last_published = MAX(COALESCE(last_published, 0), COALESCE(?, 0)) WHERE job_id = ?",
+                (last_run_at, last_published, job_id)
+            )
+            self.db.commit()
+
+    def querySelectCrawlJob(self, job_id):
+        cursor = self.db.cursor()
+        cursor.execute(f"SELECT * FROM {self.crawl_job_table} WHERE job_id = ?", (job_id,))
+        return cursor.fetchone()
+
+    def querySelectAllCrawlJobs(self):
+        cursor = self.db.cursor()
+        cursor.execute(f"SELECT * FROM {self.crawl_job_table} ORDER BY priority DESC, job_id")
+        return cursor.fetchall()
+
+    def queryDeleteCrawlJob(self, job_id):
+        with self.lock:
+            cursor = self.db.cursor()
+            cursor.execute(f"DELETE FROM {self.crawl_job_table} WHERE job_id = ?", (job_id,))
+            self.db.commit()
+
     # 기존 키워드 테이블 관련 메서드들
     def queryCreateKeywordTable(self):
         cursor = self.db.cursor()
@@ -0,0 +1,118 @@
+import datetime
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+def compress(data, codec):
+    if codec == 'zst':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def decompress(data, codec):
+    if codec == 'zst':
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+def read_archived_html(path, codec):
+    """압축된 HTML 파일 읽기 (프로세스 풀에서도 호출 가능한 모듈 함수)"""
+    with open(path, 'rb') as f:
+        return decompress(f.read(), codec)
+
+class HtmlArchive:
+    """
+    크롤링한 원본 HTML을 압축해 내용 해시(sha256)로 저장하는 아카이브
+    - 파일: <root>/<해시 앞 2자리>/<해시>.html.zst (zstandard가 없으면 .html.gz)
+    - 색인: <root>/index.db (링크 -> 해시)
+    - 같은 HTML은 한 번만 저장
+    """
+    def __init__(self, root='html_archive', codec=None):
+        self.root = root
+        self.codec = codec or ('zst' if zstandard else 'gz')
+        if self.codec == 'zst' and zstandard is None:
+            raise ValueError("zstd 압축을 쓰려면 zstandard 패키지를 설치하세요")
+        os.makedirs(self.root, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(os.path.join(self.root, 'index.db'), check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.table = 'html_archive'
+        self.columns = {
+            'link': 'text PRIMARY KEY',
+            'final_url': 'text',
+            'hash': 'text',
+            'codec': 'text',
+            'size': 'integer',
+            'stored_at': 'text',
+        }
+        colum_info = ",".join(col_name + ' ' + col_type for col_name, col_type in self.columns.items())
+        with self.lock:
+            self.db.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({colum_info})")
+            self.db.commit()
+        self.stats = {'stored': 0, 'deduplicated': 0, 'bytes_in': 0, 'bytes_out': 0}
+
+    def __del__(self):
+        self.stop()
+
+    def stop(self):
+        try:
+            self.db.close()
+        except:
+            pass
+
+    def get_path(self, content_hash, codec=None):
+        return os.path.join(self.root, content_hash[:2], f"{content_hash}.html.{codec or self.codec}")
+
+    def store(self, link, html, final_url=None):
+        """HTML 저장 후 해시 반환"""
+        content_hash = hashlib.sha256(html).hexdigest()
+        path = self.get_path(content_hash)
+
+        written = 0
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = compress(html, self.codec)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            written = len(data)
+
+        stored_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock:
+            self.db.execute(
+                f"INSERT OR REPLACE INTO {self.table} (link, final_url, hash, codec, size, stored_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (link, final_url or link, content_hash, self.codec, len(html), stored_at)
+            )
+            self.db.commit()
+            if written:
+                self.stats['stored'] += 1
+                self.stats['bytes_in'] += len(html)
+                self.stats['bytes_out'] += written
+            else:
+                self.stats['deduplicated'] += 1
+        return content_hash
+
+    def lookup(self, link):
+        """링크의 색인 정보 (없으면 None)"""
+        with self.lock:
+            return self.db.execute(f"SELECT * FROM {self.table} WHERE link = ?", (link,)).fetchone()
+
+    def load(self, link):
+        """링크의 원본 HTML (없으면 None)"""
+        row = self.lookup(link)
+        if row is None:
+            return None
+        return read_archived_html(self.get_path(row['hash'], row['codec']), row['codec'])
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['links'] = self.db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        return stats
@@ -0,0 +1,41 @@
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# 빠른 순서대로 시도 (lxml: C 기반, html.parser: 표준 라이브러리 - 항상 사용 가능)
+PARSER_PREFERENCE = ['lxml', 'html.parser']
+FALLBACK_PARSER = 'html.parser'
+
+_default_parser = None
+
+def is_parser_available(parser):
+    try:
+        BeautifulSoup('<p></p>', parser)
+        return True
+    except FeatureNotFound:
+        return False
+
+def available_parsers():
+    """현재 환경에서 쓸 수 있는 파서 목록 (빠른 순)"""
+    return [parser for parser in PARSER_PREFERENCE if is_parser_available(parser)]
+
+def get_default_parser():
+    """설치된 파서 중 가장 빠른 것 (lxml이 없으면 html.parser)"""
+    global _default_parser
+    if _default_parser is None:
+        parsers = available_parsers()
+        _default_parser = parsers[0] if parsers else FALLBACK_PARSER
+    return _default_parser
+
+def set_default_parser(parser):
+    """기본 파서 변경 (예: 결과 비교를 위해 'html.parser'로 고정)"""
+    global _default_parser
+    if not is_parser_available(parser):
+        raise ValueError(f"사용할 수 없는 파서입니다: {parser}")
+    _default_parser = parser
+
+def make_soup(markup, parser=None):
+    """모든 추출 코드가 사용하는 BeautifulSoup 생성 함수"""
+    parser = parser or get_default_parser()
+    try:
+        return BeautifulSoup(markup, parser)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, FALLBACK_PARSER)
@@ -0,0 +1,253 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import quote, unquote, urljoin
+from requests.adapters import HTTPAdapter
+
+from http_session import PooledHttpSession, count_handshakes
+
+def get_record_key(url):
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+def rewrite_url(base_url, url):
+    """원래 URL을 재생 서버 주소로 변환 (http://127.0.0.1:8780/<URL 인코딩된 원래 주소>)"""
+    return f"{base_url.rstrip('/')}/{quote(url, safe='')}"
+
+class HttpRecorder:
+    """
+    크롤링 중 받은 RSS/기사 응답을 디스크에 기록 (재생 서버의 입력)
+    - <root>/<url sha1>.json: url, 상태 코드, Content-Type, 리다이렉트 대상
+    - <root>/<url sha1>.body: 응답 본문
+    - 리다이렉트된 응답은 원래 URL에 리다이렉트만, 최종 URL에 본문을 기록
+    """
+    def __init__(self, root='http_recordings'):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+        self.lock = threading.Lock()
+        self.recorded = 0
+
+    def _write(self, url, meta, body):
+        key = get_record_key(url)
+        with self.lock:
+            with open(os.path.join(self.root, f"{key}.body"), 'wb') as f:
+                f.write(body)
+            with open(os.path.join(self.root, f"{key}.json"), 'w', encoding='utf-8') as f:
+                json.dump(dict(meta, url=url), f, ensure_ascii=False)
+            self.recorded += 1
+
+    def add(self, url, body, status=200, content_type='text/html; charset=utf-8', redirect=None):
+        """응답 직접 등록 (합성 데이터 생성용)"""
+        self._write(url, {'status': status, 'content_type': content_type, 'redirect': redirect}, body)
+
+    def record(self, url, response, content):
+        """응답 하나 기록 (304 Not Modified는 이전 기록을 덮지 않도록 건너뜀)"""
+        if response.status_code == 304:
+            return
+        location = response.headers.get('Location')
+        if 300 <= response.status_code < 400 and location:
+            # allow_redirects=False로 받은 리다이렉트 응답 (LinkResolver.follow)
+            self.add(url, b'', status=response.status_code, redirect=urljoin(url, location))
+            return
+        final_url = response.url or url
+        content_type = response.headers.get('Content-Type', '')
+        if final_url != url:
+            self.add(url, b'', status=302, content_type=content_type, redirect=final_url)
+        self.add(final_url, content or b'', status=response.status_code, content_type=content_type)
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server.replay
+        url = unquote(self.path[1:])
+        status, headers, body = server.respond(url)
+        if status is None:
+            # 연결 끊김 주입
+            self.close_connection = True
+            return
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class ReplayServer:
+    """
+    기록된 응답을 로컬에서 돌려주는 재생 서버
+    - latency/jitter: 응답마다 latency + (0~jitter)초 지연
+    - error_rate: 이 확률로 error_status 응답 (drop_rate: 연결 끊김)
+    - seed: 같은 seed면 URL별 오류 발생 순서가 항상 같음 (스레드 실행 순서와 무관)
+    """
+    def __init__(self, root='http_recordings', port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 error_status=503, drop_rate=0.0, seed=0):
+        self.root = root
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.drop_rate = drop_rate
+        self.seed = seed
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), _ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.replay = self
+        self.port = self.httpd.server_address[1]
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.thread = None
+
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.stats = {'requests': 0, 'served': 0, 'missing': 0, 'errors': 0, 'dropped': 0}
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='replay-server', daemon=True)
+        self.thread.start()
+        print(f"📼 재생 서버 시작: {self.base_url} ({self.root})")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _count(self, key):
+        with self.lock:
+            self.stats['requests'] += 1
+            self.counts[key] = self.counts.get(key, 0) + 1
+            return self.counts[key]
+
+    def _load(self, url):
+        key = get_record_key(url)
+        try:
+            with open(os.path.join(self.root, f"{key}.json"), encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(os.path.join(self.root, f"{key}.body"), 'rb') as f:
+                return meta, f.read()
+        except FileNotFoundError:
+            return None, None
+
+    def _bump(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def respond(self, url):
+        """URL 하나의 응답 (상태 코드, 헤더, 본문) - 상태 코드가 None이면 연결 끊김"""
+        n = self._count(url)
+        rng = random.Random(f"{self.seed}:{url}:{n}")
+        delay = self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        roll = rng.random()
+        if roll < self.drop_rate:
+            self._bump('dropped')
+            return None, None, None
+        if roll < self.drop_rate + self.error_rate:
+            self._bump('errors')
+            return self.error_status, {'Content-Type': 'text/plain'}, b'injected error'
+
+        meta, body = self._load(url)
+        if meta is None:
+            self._bump('missing')
+            return 404, {'Content-Type': 'text/plain'}, b'not recorded'
+
+        self._bump('served')
+        headers = {'Content-Type': meta['content_type']} if meta['content_type'] else {}
+        if meta['redirect']:
+            headers['Location'] = meta['redirect']
+        return meta['status'], headers, body
+
+    def create_session(self, **kwargs):
+        """모든 요청을 이 서버로 보내는 세션 (GoogleNewsCron/DirectContentCrawler의 http= 에 전달)"""
+        session = PooledHttpSession(**kwargs)
+        install_replay(session, self.base_url)
+        return session
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+
+class ReplayAdapter(HTTPAdapter):
+    """요청 URL만 재생 서버로 바꿔 보내고, 응답의 url은 원래 주소로 되돌리는 어댑터"""
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        original = request.url
+        request.url = rewrite_url(self.base_url, original)
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            request.url = original
+        response.url = original
+        return response
+
+def install_replay(session, base_url):
+    """
+    PooledHttpSession의 http/https 요청을 재생 서버로 돌림
+    예) install_replay(shared_session, 'http://127.0.0.1:8780')
+    """
+    adapter = count_handshakes(ReplayAdapter(base_url, pool_connections=session.pool_connections,
+                                             pool_maxsize=session.pool_maxsize))
+    session.session.mount('http://', adapter)
+    session.session.mount('https://', adapter)
+    session.adapter = adapter
+    return session
+
+def record_keywords(keywords, country='ko', root='http_recordings'):
+    """실제 Google News/언론사에 접속해 키워드별 RSS와 기사 응답을 기록"""
+    from google_news_cron import GoogleNewsCron
+
+    recorder = HttpRecorder(root)
+    session = PooledHttpSession()
+    session.recorder = recorder
+    cron = GoogleNewsCron(http=session, retry_workers=0)
+    try:
+        for keyword in keywords:
+            cron.register_keyword(country, keyword)
+            cron.exec(country, keyword)
+        cron.enricher.shutdown()
+    finally:
+        cron.stop()
+    print(f"📼 기록 완료: 응답 {recorder.recorded}개 -> {root}")
+    return recorder.recorded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='HTTP 응답 기록/재생')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    record = sub.add_parser('record', help='키워드를 실제로 크롤링하며 응답 기록')
+    record.add_argument('keywords', nargs='+')
+    record.add_argument('--country', default='ko')
+    record.add_argument('--root', default='http_recordings')
+
+    serve = sub.add_parser('serve', help='기록된 응답으로 재생 서버 실행')
+    serve.add_argument('--root', default='http_recordings')
+    serve.add_argument('--port', type=int, default=8780)
+    serve.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    serve.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 최대값 (초)')
+    serve.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    serve.add_argument('--error-status', type=int, default=503)
+    serve.add_argument('--drop-rate', type=float, default=0.0, help='연결 끊김 비율 (0~1)')
+    serve.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_keywords(args.keywords, args.country, args.root)
+    else:
+        server = ReplayServer(args.root, args.port, args.latency, args.jitter, args.error_rate,
+                              args.error_status, args.drop_rate, args.seed)
+        print(f"📼 재생 서버: {server.base_url} (Ctrl+C로 종료)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
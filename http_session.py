@@ -0,0 +1,199 @@
+import threading
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+# 본문 추출 대상으로 읽을 Content-Type
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/xml', 'application/xml', 'text/plain')
+
+class PageResult:
+    """get_page() 결과 (requests.Response에서 필요한 값만 담음)"""
+    def __init__(self, url, status_code, headers, content, truncated=False, skipped=False):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.truncated = truncated  # 바이트 예산에서 잘림
+        self.skipped = skipped      # HTML이 아니라 본문을 읽지 않음
+
+def counting_pool(pool_cls):
+    """
+    실제 연결(connect 호출) 횟수를 세는 연결 풀
+    (끝까지 읽지 않고 닫은 연결은 같은 연결 객체로 다시 연결되므로 객체 수가 아닌 connect 횟수를 셈)
+    """
+    class CountingPool(pool_cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.num_handshakes = 0
+            self.handshake_lock = threading.Lock()
+            pool = self
+
+            class CountingConnection(self.ConnectionCls):
+                def connect(self):
+                    super().connect()
+                    with pool.handshake_lock:
+                        pool.num_handshakes += 1
+
+            self.ConnectionCls = CountingConnection
+    return CountingPool
+
+COUNTING_POOL_CLASSES = {
+    'http': counting_pool(HTTPConnectionPool),
+    'https': counting_pool(HTTPSConnectionPool),
+}
+
+def count_handshakes(adapter):
+    """어댑터가 앞으로 만드는 호스트별 풀에서 연결 횟수를 세도록 설정"""
+    adapter.poolmanager.pool_classes_by_scheme = COUNTING_POOL_CLASSES
+    return adapter
+
+class PooledHttpSession:
+    """
+    모든 크롤링 경로(RSS, 기사 본문, 직접 크롤러)가 함께 쓰는 연결 풀
+    - pool_connections: 풀을 유지할 최대 호스트 수
+    - pool_maxsize: 호스트별로 유지(keep-alive)할 최대 연결 수
+    - keep_alive: False면 매 요청 후 연결을 닫음
+    """
+    def __init__(self, pool_connections=50, pool_maxsize=10, keep_alive=True, headers=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+        self.adapter = count_handshakes(HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize))
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self.lock = threading.Lock()
+        self.total_requests = 0
+        self.byte_stats = {}
+        # 응답 기록기 (http_replay.HttpRecorder) - 설정하면 받은 응답을 디스크에 저장
+        self.recorder = None
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.total_requests += 1
+        response = self.session.get(url, **kwargs)
+        if self.recorder is not None and not kwargs.get('stream'):
+            self.recorder.record(url, response, response.content)
+        return response
+
+    def get_page(self, url, max_bytes=512 * 1024, chunk_size=16 * 1024, **kwargs):
+        """
+        기사 페이지 스트리밍 다운로드
+        - Content-Type이 HTML이 아니면 본문을 읽지 않음
+        - max_bytes까지만 읽고 끊음 (None이면 전체)
+        """
+        response = self.get(url, stream=True, **kwargs)
+        try:
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                self._record_bytes(response, 0, truncated=False, skipped=True)
+                if self.recorder is not None:
+                    self.recorder.record(url, response, b'')
+                return PageResult(response.url, response.status_code, response.headers, b'', skipped=True)
+
+            chunks = []
+            read = 0
+            truncated = False
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                chunks.append(chunk)
+                read += len(chunk)
+                if max_bytes and read >= max_bytes:
+                    truncated = True
+                    break
+
+            content = b''.join(chunks)
+            if max_bytes:
+                content = content[:max_bytes]
+            self._record_bytes(response, len(content), truncated=truncated, skipped=False)
+            if self.recorder is not None:
+                self.recorder.record(url, response, content)
+            return PageResult(response.url, response.status_code, response.headers, content, truncated=truncated)
+        finally:
+            # 끝까지 읽지 않은 연결은 풀로 돌아가지 않고 닫힘
+            response.close()
+
+    def _record_bytes(self, response, read, truncated, skipped):
+        """도메인별 다운로드 바이트 / 절약 바이트 기록 (절약량은 Content-Length가 있을 때만 계산)"""
+        domain = urlparse(response.url).netloc.lower()
+        saved = 0
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and (truncated or skipped):
+            # Content-Length는 전송(압축) 크기이므로 실제로 받은 전송 바이트와 비교
+            try:
+                wire_read = response.raw.tell()
+            except Exception:
+                wire_read = read
+            saved = max(0, int(content_length) - wire_read)
+
+        with self.lock:
+            stats = self.byte_stats.setdefault(domain, {
+                'pages': 0, 'truncated': 0, 'skipped': 0, 'bytes_read': 0, 'bytes_saved': 0
+            })
+            stats['pages'] += 1
+            stats['truncated'] += 1 if truncated else 0
+            stats['skipped'] += 1 if skipped else 0
+            stats['bytes_read'] += read
+            stats['bytes_saved'] += saved
+
+    def get_byte_stats(self):
+        """도메인별 스트리밍 다운로드 통계"""
+        with self.lock:
+            return {domain: dict(stats) for domain, stats in self.byte_stats.items()}
+
+    def get_stats(self):
+        """
+        호스트별 연결 재사용 통계
+        - connections: 연결한 횟수 (TCP/TLS 핸드셰이크 횟수, 끊긴 연결의 재연결 포함)
+        - requests: 해당 호스트로 보낸 요청 수
+        - reused: 핸드셰이크 없이 기존 연결로 보낸 요청 수
+        (풀에서 밀려난 호스트는 통계에서 빠짐)
+        """
+        hosts = {}
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{key.key_scheme}://{key.key_host}" + (f":{key.key_port}" if key.key_port else "")
+            stats = hosts.setdefault(host, {'connections': 0, 'requests': 0, 'reused': 0})
+            handshakes = getattr(pool, 'num_handshakes', pool.num_connections)
+            stats['connections'] += handshakes
+            stats['requests'] += pool.num_requests
+            stats['reused'] += max(0, pool.num_requests - handshakes)
+
+        total_connections = sum(s['connections'] for s in hosts.values())
+        total_reused = sum(s['reused'] for s in hosts.values())
+        return {
+            'total_requests': self.total_requests,
+            'total_connections': total_connections,
+            'total_reused': total_reused,
+            'reuse_rate': (total_reused / (total_reused + total_connections) * 100) if total_connections else 0,
+            'hosts': hosts,
+        }
+
+    def print_stats(self):
+        stats = self.get_stats()
+        print(f"🔌 연결 풀 통계: 요청 {stats['total_requests']}회, 새 연결 {stats['total_connections']}개, "
+              f"재사용 {stats['total_reused']}회 ({stats['reuse_rate']:.1f}%)")
+        for host, item in sorted(stats['hosts'].items()):
+            print(f"   {host}: 요청 {item['requests']}회, 연결 {item['connections']}개, 재사용 {item['reused']}회")
+        for domain, item in sorted(self.get_byte_stats().items()):
+            print(f"   📦 {domain}: 페이지 {item['pages']}개 (잘림 {item['truncated']}, 건너뜀 {item['skipped']}), "
+                  f"받은 바이트 {item['bytes_read']:,}, 절약 바이트 {item['bytes_saved']:,}")
+
+    def close(self):
+        self.session.close()
+
+# 프로세스 전체에서 공유하는 기본 세션
+shared_session = PooledHttpSession()
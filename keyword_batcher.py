@@ -0,0 +1,119 @@
+import re
+from functools import lru_cache
+
+# Google 검색어 제한(약 32단어)과 URL 길이를 고려한 기본값
+MAX_QUERY_LENGTH = 300
+MAX_QUERY_TERMS = 32
+# Google News RSS는 검색어당 최대 약 100개만 반환하므로, 묶음이 크면 결과가 잘려 키워드별 누락이 생김
+MAX_BATCH_SIZE = 3
+FEED_ITEM_LIMIT = 100
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+LATIN_CHAR = re.compile(r'[a-z0-9]')
+
+def quote_keyword(keyword):
+    """공백이 있는 키워드는 구문 검색이 되도록 따옴표로 감쌈"""
+    keyword = keyword.replace('"', '')
+    return f'"{keyword}"' if ' ' in keyword.strip() else keyword
+
+def build_or_query(keywords):
+    """여러 키워드를 하나의 OR 검색어로 결합 (키워드가 하나면 그대로)"""
+    if len(keywords) == 1:
+        return keywords[0]
+    return '(' + ' OR '.join(quote_keyword(keyword) for keyword in keywords) + ')'
+
+def count_terms(keywords):
+    """검색어 단어 수 (OR 연산자 포함)"""
+    words = sum(len(keyword.split()) for keyword in keywords)
+    return words + max(0, len(keywords) - 1)
+
+def batch_keywords(keywords, max_length=MAX_QUERY_LENGTH, max_terms=MAX_QUERY_TERMS, max_batch_size=MAX_BATCH_SIZE):
+    """
+    같은 국가의 키워드들을 검색어 길이/단어 수 제한 안에서 묶음
+    반환값: [[키워드, ...], ...]
+    """
+    batches = []
+    current = []
+    for keyword in dict.fromkeys(keywords):
+        candidate = current + [keyword]
+        if current and (len(build_or_query(candidate)) > max_length
+                        or count_terms(candidate) > max_terms
+                        or len(candidate) > max_batch_size):
+            batches.append(current)
+            candidate = [keyword]
+        current = candidate
+    if current:
+        batches.append(current)
+    return batches
+
+def is_full_feed(entries, limit=FEED_ITEM_LIMIT):
+    """피드가 반환 한도까지 찼는지 (찼으면 결과가 잘렸을 수 있음)"""
+    return len(entries) >= limit
+
+def split_batch(batch):
+    """잘린 묶음을 반으로 나눔 (키워드가 하나면 나누지 않음)"""
+    if len(batch) < 2:
+        return []
+    middle = (len(batch) + 1) // 2
+    return [batch[:middle], batch[middle:]]
+
+def group_by_country(keyword_countries):
+    """[(키워드, 국가), ...] -> {국가: [키워드, ...]}"""
+    groups = {}
+    for keyword, country in keyword_countries:
+        groups.setdefault(country, []).append(keyword)
+    return groups
+
+def entry_text(entry):
+    """키워드 매칭에 쓸 텍스트 (제목 + 요약, HTML 태그 제거)"""
+    summary = TAG_PATTERN.sub(' ', entry.get('summary', '') or '')
+    return f"{entry.get('title', '')} {summary}".lower()
+
+def term_pattern(term):
+    """
+    단어 하나의 검색 패턴 - 영문/숫자로 시작하거나 끝나는 쪽에만 단어 경계 적용
+    ('ai'가 'maintain'에 걸리지 않고, 'AI가'처럼 한글 조사가 붙은 경우와 한글 단어는 부분 일치 유지)
+    """
+    pattern = re.escape(term)
+    if LATIN_CHAR.match(term[0]):
+        pattern = r'(?<![a-z0-9])' + pattern
+    if LATIN_CHAR.match(term[-1]):
+        pattern += r'(?![a-z0-9])'
+    return pattern
+
+@lru_cache(maxsize=1024)
+def keyword_pattern(keyword):
+    """키워드 검색 패턴 - 여러 단어면 quote_keyword와 같이 구문(단어 사이 공백만 허용)으로 매칭"""
+    terms = keyword.replace('"', '').lower().split()
+    if not terms:
+        return None
+    return re.compile(r'\s+'.join(term_pattern(term) for term in terms))
+
+def match_keywords(entry, keywords):
+    """제목/요약에 키워드가 단어(여러 단어면 구문) 단위로 들어 있는 키워드 목록"""
+    text = entry_text(entry)
+    matched = []
+    for keyword in keywords:
+        pattern = keyword_pattern(keyword)
+        if pattern is not None and pattern.search(text):
+            matched.append(keyword)
+    return matched
+
+def route_entries(entries, keywords):
+    """
+    결합 검색 결과를 키워드별로 분배 (한 기사가 여러 키워드에 들어갈 수 있음)
+    반환값: ({키워드: [엔트리, ...]}, 어느 키워드에도 맞지 않은 엔트리 수)
+    """
+    if len(keywords) == 1:
+        # 단독 검색이면 Google 검색 결과를 그대로 사용
+        return {keywords[0]: list(entries)}, 0
+
+    routed = {keyword: [] for keyword in keywords}
+    unmatched = 0
+    for entry in entries:
+        matched = match_keywords(entry, keywords)
+        if not matched:
+            unmatched += 1
+        for keyword in matched:
+            routed[keyword].append(entry)
+    return routed, unmatched
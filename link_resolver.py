@@ -0,0 +1,142 @@
+import sqlite3
+import threading
+import datetime
+from collections import OrderedDict
+from urllib.parse import urlparse, urljoin
+
+# RSS 링크가 가리키는 리다이렉트 호스트 (실제 언론사가 아님)
+REDIRECT_HOSTS = ('news.google.com',)
+REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+# 리다이렉트 홉은 본문 없는 가벼운 요청이라 언론사보다 훨씬 짧은 간격만 둠
+REDIRECT_INTERVAL = 0.05
+
+def is_redirect_host(host):
+    return host in REDIRECT_HOSTS
+
+class LinkResolver:
+    """
+    Google News 리다이렉트 링크 -> 실제 언론사 URL 영구 캐시
+    - google_news.db 옆의 link_cache.db 에 저장
+    - 한 번 확인한 링크는 다음 크롤링부터 리다이렉트 없이 바로 언론사로 요청
+    - 메모리에는 최근 링크 max_cached개만 LRU로 기억 (밀려난 링크는 link_cache.db에서 다시 읽음)
+    """
+    def __init__(self, db_path='link_cache.db', max_cached=10000):
+        self.db_path = db_path
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        self.table = 'resolved_link'
+        self.columns = {
+            'url': 'text PRIMARY KEY',
+            'resolved_url': 'text',
+            'domain': 'text',
+            'resolved_at': 'text',
+        }
+        self.max_cached = max_cached
+        self.cache = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+
+        colum_info = ",".join(col_name + ' ' + col_type for col_name, col_type in self.columns.items())
+        with self.lock:
+            self.db.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({colum_info})")
+            self.db.commit()
+
+    def __del__(self):
+        self.stop()
+
+    def stop(self):
+        try:
+            self.db.close()
+        except:
+            pass
+
+    def lookup(self, url):
+        """캐시된 최종 URL 반환 (없으면 None)"""
+        with self.lock:
+            if url in self.cache:
+                self.cache.move_to_end(url)
+                return self.cache[url]
+            row = self.db.execute(f"SELECT resolved_url FROM {self.table} WHERE url = ?", (url,)).fetchone()
+            resolved = row['resolved_url'] if row else None
+            if resolved:
+                self._cache_put(url, resolved)
+            return resolved
+
+    def _cache_put(self, url, resolved_url):
+        """메모리 캐시에 넣고 max_cached를 넘으면 가장 오래 안 쓴 링크부터 제거 (lock 안에서 호출)"""
+        self.cache[url] = resolved_url
+        self.cache.move_to_end(url)
+        while len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+            self.stats['evicted'] += 1
+
+    def resolve(self, url):
+        """요청에 사용할 URL (캐시에 있으면 언론사 URL, 없으면 원래 URL)"""
+        resolved = self.lookup(url)
+        with self.lock:
+            self.stats['hits' if resolved else 'misses'] += 1
+        return resolved or url
+
+    def follow(self, url, http, politeness=None, **kwargs):
+        """
+        리다이렉트 링크를 직접 따라가 언론사 URL 확인 (allow_redirects=False로 Location만 읽음)
+        - 캐시에 있으면 요청 없이 반환, 리다이렉트 호스트가 아니면 그대로 반환
+        - 리다이렉트 홉은 politeness에서 REDIRECT_INTERVAL 간격만 지킴 (언론사 간격과 별도)
+        반환값: 요청할 URL (Location이 없으면 마지막으로 확인한 URL)
+        """
+        current = self.resolve(url)
+        for _ in range(MAX_REDIRECTS):
+            host = urlparse(current).netloc.lower()
+            if not is_redirect_host(host):
+                break
+            if politeness is not None:
+                politeness.set_host_interval(host, REDIRECT_INTERVAL, jitter=0)
+                politeness.wait(current)
+            response = http.get(current, allow_redirects=False, **kwargs)
+            response.close()
+            location = response.headers.get('Location')
+            if response.status_code not in REDIRECT_STATUS_CODES or not location:
+                break
+            current = urljoin(current, location)
+        self.remember(url, current)
+        return current
+
+    def remember(self, url, resolved_url):
+        """리다이렉트를 따라간 최종 URL 저장"""
+        if not resolved_url or resolved_url == url:
+            return
+        domain = urlparse(resolved_url).netloc.lower()
+        resolved_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock:
+            if self.cache.get(url) == resolved_url:
+                return
+            self._cache_put(url, resolved_url)
+            self.db.execute(
+                f"INSERT OR REPLACE INTO {self.table} (url, resolved_url, domain, resolved_at) VALUES (?, ?, ?, ?)",
+                (url, resolved_url, domain, resolved_at)
+            )
+            self.db.commit()
+            self.stats['stored'] += 1
+
+    def get_domain(self, url):
+        """링크의 실제 언론사 도메인 (캐시에 없으면 링크 자체의 도메인)"""
+        return urlparse(self.lookup(url) or url).netloc.lower()
+
+    def get_stats(self):
+        """hits/misses: 리다이렉트 캐시 적중/실패 수, stored: 저장 수, evicted: 메모리에서 밀려난 수, cached: 메모리에 있는 링크 수"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['cached'] = len(self.cache)
+        return stats
+
+_shared_resolver = None
+_shared_lock = threading.Lock()
+
+def get_shared_resolver():
+    """프로세스 공용 리졸버 (처음 사용할 때 link_cache.db 생성)"""
+    global _shared_resolver
+    with _shared_lock:
+        if _shared_resolver is None:
+            _shared_resolver = LinkResolver()
+        return _shared_resolver
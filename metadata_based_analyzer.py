@@ -1,14 +1,17 @@
-import sqlite3
 import re
-from datetime import datetime, timedelta
+import time
 from collections import Counter
 import json
 
+from google_news_dbmanager import GoogleNewsDBManager
+from rss_date import kst_day, format_kst_day
+
 class MetadataBasedAnalyzer:
     def __init__(self):
-        self.DBName = 'google_news.db'
-        self.db = sqlite3.connect(self.DBName, check_same_thread=False)
-        self.db.row_factory = sqlite3.Row
+        # 크롤러와 같은 DB (예전 테이블의 published_ts 컬럼 채우기에 사용)
+        self.dbManager = GoogleNewsDBManager()
+        self.db = self.dbManager.db
+        self.migrated = set()
         
         # 감정 분석 키워드 (간단한 규칙 기반)
         self.sentiment_keywords = {
@@ -122,20 +125,27 @@ class MetadataBasedAnalyzer:
         
         return entities
 
+    def ensure_published_ts(self, keyword):
+        """published_ts 컬럼이 없는 예전 테이블이면 추가하고 채움 (키워드당 한 번)"""
+        if keyword.lower() not in self.migrated:
+            self.dbManager.queryMigratePublishedTs(keyword)
+            self.migrated.add(keyword.lower())
+
     def get_news_statistics(self, keyword, days=7):
         """키워드별 뉴스 통계 분석"""
         try:
             table_name = f'google_news_{keyword.lower()}'
+            self.ensure_published_ts(keyword)
             
-            # 최근 N일간 뉴스 조회
+            # 최근 N일간 뉴스 조회 (published_ts 인덱스 사용)
             query = f"""
             SELECT * FROM {table_name} 
-            WHERE published >= datetime('now', '-{days} days')
-            ORDER BY published DESC
+            WHERE published_ts >= ?
+            ORDER BY published_ts DESC
             """
             
             cursor = self.db.cursor()
-            cursor.execute(query)
+            cursor.execute(query, (int(time.time()) - days * 86400,))
             news_list = cursor.fetchall()
             
             if not news_list:
@@ -159,7 +169,7 @@ class MetadataBasedAnalyzer:
             for news in news_list:
                 title = news['title']
                 source = news['source']
-                published = news['published']
+                published_ts = news['published_ts']
                 
                 # 출처별 카운트
                 stats['sources'][source] += 1
@@ -172,18 +182,15 @@ class MetadataBasedAnalyzer:
                 topic = self.classify_news_topic(title)
                 stats['topics'][topic] += 1
                 
-                # 일별 카운트
-                try:
-                    date = datetime.strptime(published, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d')
-                    stats['daily_counts'][date] += 1
-                except:
-                    pass
+                # 일별 카운트 (한국 시간 날짜 번호로 세고 마지막에 문자열로 변환)
+                stats['daily_counts'][kst_day(published_ts)] += 1
                 
                 # 엔티티 추출
                 entities = self.extract_key_entities(title)
                 stats['entities']['companies'].update(entities['companies'])
                 stats['entities']['numbers'].update(entities['numbers'])
             
+            stats['daily_counts'] = Counter({format_kst_day(day): count for day, count in stats['daily_counts'].items()})
             return stats
             
         except Exception as e:
@@ -252,14 +259,15 @@ class MetadataBasedAnalyzer:
         """키워드와 함께 언급되는 트렌딩 키워드 추출"""
         try:
             table_name = f'google_news_{keyword.lower()}'
+            self.ensure_published_ts(keyword)
             
             query = f"""
             SELECT title FROM {table_name} 
-            WHERE published >= datetime('now', '-{days} days')
+            WHERE published_ts >= ?
             """
             
             cursor = self.db.cursor()
-            cursor.execute(query)
+            cursor.execute(query, (int(time.time()) - days * 86400,))
             titles = [row['title'] for row in cursor.fetchall()]
             
             # 제목에서 키워드 추출
@@ -1,5 +1,4 @@
 from google_news_cron import GoogleNewsCron
-import time
 
 def test_multiple_keywords():
     print("=== 여러 키워드로 Google News 크롤링 테스트 ===")
@@ -16,14 +15,16 @@ def test_multiple_keywords():
     ]
     
     try:
+        # 같은 국가 키워드는 OR 검색어 하나로 묶어 크롤링
+        futures = cron.run_batch(mode='once', keywords=keywords)
+        
+        # 국가별 수집(본문 채우기 포함)이 모두 끝날 때까지 대기
+        for future in futures:
+            stats = future.result()
+            print(f"{stats['country']}: 새 기사 {stats['new_articles']}개, 본문 {stats['filled']}개 채움 ({stats['elapsed']:.1f}초)")
+        
         for keyword, country in keywords:
-            print(f"\n=== '{keyword}' 키워드로 {country} 뉴스 크롤링 시작 ===")
-            
-            # 크롤링 실행
-            cron.run(mode='once', country=country, keyword=keyword)
-            
-            # 잠시 대기
-            time.sleep(3)
+            print(f"\n=== '{keyword}' 키워드 ({country}) 크롤링 결과 ===")
             
             # 결과 확인
             results = cron.dbManager.querySelectAllGoogleNewsTable(keyword)
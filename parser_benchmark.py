@@ -0,0 +1,92 @@
+import argparse
+import os
+import time
+
+from html_parser_backend import make_soup, available_parsers
+from content_extractor import extract_news_content
+from direct_content_test import DirectContentCrawler
+
+def build_sample_pages():
+    """고정 페이지가 없을 때 쓰는 합성 샘플 (네이버형 / article형 / p태그형 / 대형 페이지)"""
+    sentence = '삼성전자가 차세대 반도체 생산라인 투자를 확대한다고 밝혔다. '
+    noise = ''.join(f'<div class="ad-{i}"><a href="/link/{i}">관련 링크 {i}</a><span>광고 {i}</span></div>' for i in range(300))
+    scripts = '<script>var x = 1;</script>' * 50
+
+    return {
+        'naver_like.html': f'<html><head>{scripts}</head><body><nav>메뉴</nav>{noise}'
+                           f'<div id="dic_area">{sentence * 30}</div><footer>Copyright</footer></body></html>',
+        'article_like.html': f'<html><head><title>기사</title></head><body><header>헤더</header>{noise}'
+                             f'<article><h1>제목</h1><p>{sentence * 20}</p></article></body></html>',
+        'paragraph_only.html': '<html><body>' + ''.join(f'<p>{sentence}{i}</p>' for i in range(40)) + '</body></html>',
+        'heavy_page.html': f'<html><head>{scripts * 10}</head><body>{noise * 10}'
+                           f'<div class="article-body">{sentence * 50}</div>{noise * 5}</body></html>',
+    }
+
+def load_pages(paths):
+    """파일/폴더 경로에서 .html 페이지 읽기"""
+    pages = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(('.html', '.htm')):
+                    with open(os.path.join(path, name), 'rb') as f:
+                        pages[name] = f.read()
+        else:
+            with open(path, 'rb') as f:
+                pages[os.path.basename(path)] = f.read()
+    return pages
+
+def benchmark_page(html, parser, repeat, crawler):
+    """파서별 평균 파싱 시간(ms)과 추출 결과"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        soup = make_soup(html, parser)
+    parse_ms = (time.perf_counter() - start) / repeat * 1000
+
+    news_content, _ = extract_news_content(soup)
+    direct_content = crawler.extract_from_html('', html, parser)
+    return parse_ms, news_content, direct_content
+
+def run_benchmark(pages, repeat=5):
+    parsers = available_parsers()
+    crawler = DirectContentCrawler()
+    totals = {parser: 0.0 for parser in parsers}
+    mismatches = []
+
+    print(f"🧪 파서 벤치마크: 페이지 {len(pages)}개, 파서 {parsers}, 반복 {repeat}회")
+    print("-" * 70)
+
+    for name, html in pages.items():
+        results = {}
+        for parser in parsers:
+            results[parser] = benchmark_page(html, parser, repeat, crawler)
+            totals[parser] += results[parser][0]
+
+        timing = ', '.join(f"{parser} {results[parser][0]:.2f}ms" for parser in parsers)
+        print(f"{name} ({len(html):,} bytes): {timing}")
+
+        # 모든 파서의 추출 결과가 기준 파서(html.parser)와 같은지 확인
+        baseline = results.get('html.parser')
+        for parser in parsers:
+            if baseline and results[parser][1:] != baseline[1:]:
+                mismatches.append((name, parser))
+                print(f"   ⚠️ {parser} 추출 결과가 html.parser와 다름")
+
+    print("-" * 70)
+    for parser in parsers:
+        print(f"{parser}: 페이지당 평균 {totals[parser] / max(1, len(pages)):.2f}ms")
+    if 'html.parser' in totals and len(parsers) > 1 and totals[parsers[0]] > 0:
+        print(f"⚡ {parsers[0]} 속도 향상: {totals['html.parser'] / totals[parsers[0]]:.1f}배")
+    print(f"추출 결과 불일치: {len(mismatches)}건")
+    return totals, mismatches
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='HTML 파서 백엔드별 파싱 시간 / 추출 결과 비교')
+    arg_parser.add_argument('paths', nargs='*', help='HTML 파일 또는 폴더 (없으면 합성 샘플 사용)')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='페이지당 반복 횟수')
+    args = arg_parser.parse_args()
+
+    pages = load_pages(args.paths) if args.paths else {
+        name: html.encode('utf-8') for name, html in build_sample_pages().items()
+    }
+    run_benchmark(pages, args.repeat)
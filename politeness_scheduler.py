@@ -0,0 +1,113 @@
+import threading
+import time
+import random
+from urllib.parse import urlparse
+
+class DomainPolitenessScheduler:
+    """
+    도메인(호스트)별 요청 간격 스케줄러
+    - 같은 호스트로 가는 요청은 min_interval + (0 ~ jitter)초 간격을 보장
+    - 서로 다른 호스트로 가는 요청은 기다리지 않고 병렬 진행
+    - 호스트별 대기열 길이와 대기 시간을 get_stats()로 확인 가능
+    """
+    def __init__(self, min_interval=1.0, jitter=1.0):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.host_intervals = {}   # 호스트별 간격 재정의
+        self.host_jitters = {}     # 호스트별 jitter 재정의 (robots.txt Crawl-delay 등)
+        self.next_slot = {}        # 호스트별 다음 요청 가능 시각
+        self.last_sent = {}        # 호스트별 실제 전송 시각 (mark_sent 기록)
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def get_host(self, url):
+        return urlparse(url).netloc.lower()
+
+    def set_host_interval(self, host, seconds, jitter=None):
+        """특정 호스트의 최소 간격 변경 (jitter를 주면 해당 호스트의 무작위 추가 간격도 변경)"""
+        with self.lock:
+            self.host_intervals[host] = seconds
+            if jitter is not None:
+                self.host_jitters[host] = jitter
+
+    def get_interval(self, host):
+        base = self.host_intervals.get(host, self.min_interval)
+        jitter = self.host_jitters.get(host, self.jitter)
+        return base + (random.uniform(0, jitter) if jitter else 0)
+
+    def _host_stats(self, host):
+        if host not in self.stats:
+            self.stats[host] = {
+                'requests': 0,
+                'queue_depth': 0,
+                'max_queue_depth': 0,
+                'total_wait': 0.0,
+                'max_wait': 0.0,
+                'rechecks': 0,
+            }
+        return self.stats[host]
+
+    def wait(self, url):
+        """요청 직전에 호출: 해당 호스트 차례가 올 때까지 대기 후 대기 시간(초) 반환"""
+        host = self.get_host(url)
+
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_slot.get(host, now))
+            # 다음 요청 시각을 미리 예약해 동시에 들어온 요청끼리도 간격 유지
+            self.next_slot[host] = start + self.get_interval(host)
+
+            stats = self._host_stats(host)
+            stats['requests'] += 1
+            stats['queue_depth'] += 1
+            stats['max_queue_depth'] = max(stats['max_queue_depth'], stats['queue_depth'])
+
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+        with self.lock:
+            stats['queue_depth'] -= 1
+            stats['total_wait'] += delay
+            stats['max_wait'] = max(stats['max_wait'], delay)
+
+        return delay
+
+    def mark_sent(self, url):
+        """
+        실제 전송 직전에 호출 (wait() 뒤 다른 대기(예: CrawlBudget 슬롯)를 거친 경우)
+        - 마지막 전송 후 최소 간격이 지났으면 전송 시각을 기록하고 0 반환
+        - 대기 중에 같은 호스트 요청이 먼저 나갔으면 기록 없이 남은 시간(초) 반환 -> 호출한 쪽이 wait()부터 다시
+        """
+        host = self.get_host(url)
+
+        with self.lock:
+            now = time.monotonic()
+            last = self.last_sent.get(host)
+            remaining = last + self.host_intervals.get(host, self.min_interval) - now if last is not None else 0
+            if remaining > 0:
+                self._host_stats(host)['rechecks'] += 1
+                return remaining
+            self.last_sent[host] = now
+            # 이후 wait()도 실제 전송 시각 기준으로 간격을 잡도록 예약 시각을 뒤로 미룸
+            self.next_slot[host] = max(self.next_slot.get(host, now), now + self.get_interval(host))
+            return 0
+
+    def get_stats(self):
+        """호스트별 통계 (queue_depth: 현재 대기 중인 요청 수, avg_wait: 평균 대기 초, rechecks: mark_sent에서 다시 기다리게 한 횟수)"""
+        with self.lock:
+            result = {}
+            for host, stats in self.stats.items():
+                item = dict(stats)
+                item['avg_wait'] = stats['total_wait'] / stats['requests'] if stats['requests'] else 0.0
+                result[host] = item
+            return result
+
+    def print_stats(self):
+        print("🕒 호스트별 요청 간격 통계")
+        for host, stats in sorted(self.get_stats().items()):
+            print(f"   {host}: 요청 {stats['requests']}회, 대기열 {stats['queue_depth']} (최대 {stats['max_queue_depth']}), "
+                  f"평균 대기 {stats['avg_wait']:.2f}초, 최대 대기 {stats['max_wait']:.2f}초")
+
+# 모든 크롤러가 공유하는 기본 스케줄러 (같은 호스트 제한을 프로세스 전체에 적용)
+shared_scheduler = DomainPolitenessScheduler()
@@ -0,0 +1,84 @@
+import argparse
+import os
+import time
+
+from google_news_dbmanager import GoogleNewsDBManager, escape_quotes
+from html_archive import HtmlArchive, read_archived_html
+from content_extractor import extract_news_content_from_html, MAX_CONTENT_LENGTH
+from extraction_pool import create_extraction_pool
+
+def reextract_one(path, codec):
+    """보관된 HTML 하나를 현재 추출기로 다시 추출 (프로세스 풀 작업 함수)"""
+    try:
+        content, _ = extract_news_content_from_html(read_archived_html(path, codec))
+    except Exception:
+        return "크롤링 오류"
+    return content[:MAX_CONTENT_LENGTH] if content else "내용 추출 실패"
+
+def get_news_tables(dbManager, keywords=None):
+    """다시 추출할 키워드 목록 (지정하지 않으면 DB의 모든 google_news_ 테이블)"""
+    if keywords:
+        return list(keywords)
+    cursor = dbManager.db.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'google_news_%'")
+    return [row[0][len('google_news_'):] for row in cursor.fetchall()]
+
+def reextract_archive(keywords=None, workers='auto', archive_root='html_archive', dry_run=False):
+    """
+    보관된 HTML을 현재 추출기로 병렬 재추출해 content를 갱신
+    반환값: {'checked', 'archived', 'changed', 'healed'}
+    """
+    dbManager = GoogleNewsDBManager()
+    archive = HtmlArchive(archive_root)
+    dbManager.queryCreateRetryQueueTable()
+    pool = create_extraction_pool(workers or 1)
+    stats = {'checked': 0, 'archived': 0, 'changed': 0, 'healed': 0}
+    started = time.time()
+
+    try:
+        for keyword in get_news_tables(dbManager, keywords):
+            rows = dbManager.querySelectAllGoogleNewsTable(keyword)
+            jobs = []
+            for row in rows:
+                stats['checked'] += 1
+                archived = archive.lookup(row['link'])
+                if archived is None:
+                    continue
+                path = archive.get_path(archived['hash'], archived['codec'])
+                if not os.path.exists(path):
+                    continue
+                jobs.append((row, pool.submit(reextract_one, path, archived['codec'])))
+
+            stats['archived'] += len(jobs)
+            print(f"♻️ [{keyword}] 뉴스 {len(rows)}개 중 보관된 HTML {len(jobs)}개 재추출")
+
+            for row, future in jobs:
+                content = future.result()
+                # DB에는 따옴표가 처리된 값이 있으므로 같은 처리를 한 뒤 비교 (안 하면 따옴표 있는 기사가 매번 변경으로 잡힘)
+                if escape_quotes(content) == row['content'] or content in ("내용 추출 실패", "크롤링 오류"):
+                    continue
+                stats['changed'] += 1
+                if row['content'] in ("", "접근 실패", "크롤링 오류", "내용 추출 실패", "접근 보류"):
+                    stats['healed'] += 1
+                if not dry_run:
+                    dbManager.queryUpdateGoogleNewsContent(keyword, row['link'], content)
+                    dbManager.queryDeleteRetry(keyword, row['link'])
+    finally:
+        pool.shutdown()
+        archive.stop()
+        dbManager.stop()
+
+    print(f"✅ 재추출 완료 ({time.time() - started:.1f}초): 확인 {stats['checked']}개, 보관 {stats['archived']}개, "
+          f"변경 {stats['changed']}개 (실패 기사 복구 {stats['healed']}개){' - dry run' if dry_run else ''}")
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='보관된 원본 HTML을 현재 추출기로 다시 추출해 content 갱신')
+    parser.add_argument('keywords', nargs='*', help='대상 키워드 (없으면 전체 뉴스 테이블)')
+    parser.add_argument('--workers', default='auto', help="추출 프로세스 수 (기본값: 'auto' = CPU 코어 수)")
+    parser.add_argument('--archive', default='html_archive', help='아카이브 폴더')
+    parser.add_argument('--dry-run', action='store_true', help='DB를 바꾸지 않고 변경될 개수만 확인')
+    args = parser.parse_args()
+
+    workers = args.workers if args.workers == 'auto' else int(args.workers)
+    reextract_archive(args.keywords, workers, args.archive, args.dry_run)
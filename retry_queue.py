@@ -0,0 +1,136 @@
+import threading
+import time
+
+# 재시도 대상 content 상태 (GoogleNewsCron.download / extract_news_result 결과)
+RETRYABLE_STATUSES = ("접근 실패", "크롤링 오류", "내용 추출 실패", "접근 보류")
+
+# 메타데이터만 저장되고 본문 채우기를 기다리는 기사의 대기열 상태
+PENDING_STATUS = "수집 대기"
+
+class RetryQueue:
+    """
+    본문 크롤링에 실패한 기사를 SQLite(retry_queue 테이블)에 보관하는 재시도 대기열
+    - 시도 간격: base_delay초에서 시작해 실패할 때마다 2배 (최대 max_delay초)
+    - max_attempts번 실패하면 포기 (next_attempt_at = NULL 로 남겨 기록 유지)
+    """
+    def __init__(self, dbManager, base_delay=60, max_delay=6 * 3600, max_attempts=5):
+        self.dbManager = dbManager
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.dbManager.queryCreateRetryQueueTable()
+
+    def is_retryable(self, content):
+        return content in RETRYABLE_STATUSES
+
+    def next_delay(self, attempts):
+        return min(self.max_delay, self.base_delay * (2 ** attempts))
+
+    def enqueue(self, keyword, link, status, delay=None):
+        """실패한 기사 등록 (첫 시도는 delay초 후, 기본값 base_delay)"""
+        delay = self.base_delay if delay is None else delay
+        return self.dbManager.queryEnqueueRetry(keyword, link, status, int(time.time()) + delay)
+
+    def enqueue_failed_rows(self, keyword):
+        """이미 실패 상태로 저장된 기사들을 대기열에 등록 (대기열 도입 전 데이터 포함)"""
+        added = 0
+        for row in self.dbManager.querySelectLinksByContent(keyword, RETRYABLE_STATUSES):
+            added += self.enqueue(keyword, row['link'], row['content'])
+        if added:
+            print(f"🔁 [{keyword}] 실패 기사 {added}개 재시도 대기열 등록")
+        return added
+
+    def due(self, limit=20):
+        return self.dbManager.querySelectDueRetries(int(time.time()), limit)
+
+    def mark_success(self, keyword, link, content):
+        self.dbManager.queryUpdateGoogleNewsContent(keyword, link, content)
+        self.dbManager.queryDeleteRetry(keyword, link)
+
+    def mark_failure(self, keyword, link, attempts, status):
+        attempts += 1
+        if attempts >= self.max_attempts:
+            next_attempt_at = None
+            print(f"   🛑 재시도 포기 ({attempts}회 실패): {link[:50]}...")
+        else:
+            next_attempt_at = int(time.time()) + self.next_delay(attempts)
+        self.dbManager.queryUpdateRetry(keyword, link, attempts, next_attempt_at, status)
+
+    def get_stats(self):
+        return self.dbManager.queryGetRetryStats()
+
+class RetryWorker:
+    """
+    재시도 대기열을 백그라운드에서 비우는 작업자
+    - fetch_func: 링크 하나의 content를 돌려주는 함수 (예: GoogleNewsCron.get_content)
+    - workers: 동시에 재시도할 스레드 수
+    """
+    def __init__(self, queue, fetch_func, workers=1, poll_interval=30, batch_size=20):
+        self.queue = queue
+        self.fetch_func = fetch_func
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.stop_event = threading.Event()
+        self.threads = []
+        self.claim_lock = threading.Lock()
+        self.claimed = set()
+        self.stats = {'attempts': 0, 'healed': 0, 'failed': 0}
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f'retry-worker-{i}', daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self, timeout=5):
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+
+    def _claim(self):
+        """다른 작업자와 겹치지 않게 처리할 항목 하나 가져오기"""
+        with self.claim_lock:
+            for row in self.queue.due(self.batch_size):
+                key = (row['keyword'], row['link'])
+                if key not in self.claimed:
+                    self.claimed.add(key)
+                    return row
+        return None
+
+    def _release(self, row):
+        with self.claim_lock:
+            self.claimed.discard((row['keyword'], row['link']))
+
+    def run_once(self):
+        """due 항목 하나 처리 (처리할 항목이 없으면 False)"""
+        row = self._claim()
+        if row is None:
+            return False
+
+        try:
+            content = self.fetch_func(row['link'])
+            healed = not self.queue.is_retryable(content)
+            if healed:
+                self.queue.mark_success(row['keyword'], row['link'], content)
+                print(f"   🔁 재시도 성공: {row['link'][:50]}...")
+            else:
+                self.queue.mark_failure(row['keyword'], row['link'], row['attempts'], content)
+            with self.claim_lock:
+                self.stats['attempts'] += 1
+                self.stats['healed' if healed else 'failed'] += 1
+        except Exception as e:
+            print(f"재시도 오류: {e}")
+        finally:
+            self._release(row)
+        return True
+
+    def get_stats(self):
+        with self.claim_lock:
+            return dict(self.stats)
+
+    def _loop(self):
+        while not self.stop_event.is_set():
+            if not self.run_once():
+                self.stop_event.wait(self.poll_interval)
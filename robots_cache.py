@@ -0,0 +1,155 @@
+import threading
+import time
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from http_session import shared_session
+from politeness_scheduler import shared_scheduler
+
+# robots.txt를 읽을 수 없을 때(5xx/네트워크 오류)의 상태
+UNREACHABLE = 'unreachable'
+
+def parse_crawl_delay(lines, user_agent='*'):
+    """
+    Crawl-delay 값 (소수 허용 - urllib.robotparser는 정수만 읽음)
+    user_agent와 일치하는 그룹을 우선하고, 없으면 '*' 그룹 값을 사용
+    """
+    agent = user_agent.lower()
+    delays = {}
+    group = []
+    in_rules = False
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        field, value = (part.strip() for part in line.split(':', 1))
+        field = field.lower()
+        if field == 'user-agent':
+            if in_rules:
+                group = []
+                in_rules = False
+            group.append(value.lower())
+        elif field == 'crawl-delay':
+            in_rules = True
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            for name in group:
+                delays.setdefault(name, delay)
+        else:
+            in_rules = True
+
+    if agent != '*':
+        for name, delay in delays.items():
+            if name != '*' and name in agent:
+                return delay
+    return delays.get('*')
+
+class RobotsCache:
+    """
+    호스트별 robots.txt 캐시
+    - 한 번 읽은 robots.txt는 ttl초 동안 재사용 (읽기 실패는 error_ttl초 뒤 다시 시도)
+    - Crawl-delay/Request-rate가 있으면 그 간격을 politeness 스케줄러에 적용 (최대 max_crawl_delay초)
+    - robots.txt가 허용하고 Crawl-delay가 없으면 default_delay초 간격으로 당김 (None이면 기본 간격 유지)
+    - 401/403은 전체 금지, 그 밖의 4xx는 전체 허용, 5xx/네트워크 오류는 허용하고 나중에 다시 확인
+    """
+    def __init__(self, http=None, politeness=None, user_agent='*', ttl=24 * 3600, error_ttl=600,
+                 default_delay=0.5, max_crawl_delay=60):
+        self.http = http or shared_session
+        self.politeness = politeness or shared_scheduler
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.default_delay = default_delay
+        self.max_crawl_delay = max_crawl_delay
+
+        self.lock = threading.Lock()
+        self.host_locks = {}
+        self.rules = {}   # 호스트 -> {'parser', 'status', 'delay', 'expires_at'}
+        self.stats = {'fetched': 0, 'errors': 0, 'allowed': 0, 'disallowed': 0}
+
+    def _host_lock(self, host):
+        with self.lock:
+            return self.host_locks.setdefault(host, threading.Lock())
+
+    def _fetch(self, scheme, host):
+        """robots.txt 요청 후 (parser, 상태 코드 또는 UNREACHABLE, Crawl-delay)"""
+        parser = RobotFileParser(f"{scheme}://{host}/robots.txt")
+        try:
+            response = self.http.get(parser.url, timeout=10)
+            status = response.status_code
+        except Exception:
+            parser.allow_all = True
+            return parser, UNREACHABLE, None
+
+        if status == 200:
+            lines = response.text.splitlines()
+            parser.parse(lines)
+            return parser, status, self._get_delay(parser, lines)
+        elif status in (401, 403):
+            parser.disallow_all = True
+        elif 400 <= status < 500:
+            parser.allow_all = True
+        else:
+            parser.allow_all = True
+            return parser, UNREACHABLE, None
+        return parser, status, None
+
+    def _get_delay(self, parser, lines):
+        """Crawl-delay (없으면 Request-rate로 계산한 간격)"""
+        delay = parse_crawl_delay(lines, self.user_agent)
+        if delay is None:
+            rate = parser.request_rate(self.user_agent)
+            if rate and rate.requests:
+                delay = rate.seconds / rate.requests
+        if delay is None:
+            return None
+        return min(float(delay), self.max_crawl_delay)
+
+    def get_rules(self, url):
+        """URL 호스트의 robots.txt 규칙 (만료됐으면 다시 읽고 요청 간격 갱신)"""
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        item = self.rules.get(host)
+        if item and item['expires_at'] > time.monotonic():
+            return item
+
+        # 같은 호스트의 robots.txt는 동시에 한 번만 요청
+        with self._host_lock(host):
+            item = self.rules.get(host)
+            if item and item['expires_at'] > time.monotonic():
+                return item
+
+            parser, status, delay = self._fetch(parsed.scheme or 'https', host)
+            reachable = status != UNREACHABLE
+            item = {
+                'parser': parser,
+                'status': status,
+                'delay': delay,
+                'expires_at': time.monotonic() + (self.ttl if reachable else self.error_ttl),
+            }
+            with self.lock:
+                self.rules[host] = item
+                self.stats['fetched' if reachable else 'errors'] += 1
+
+            if delay is not None:
+                self.politeness.set_host_interval(host, delay, jitter=0)
+                print(f"   🤖 {host} Crawl-delay {delay}초 적용")
+            elif reachable and self.default_delay is not None:
+                self.politeness.set_host_interval(host, self.default_delay, jitter=0)
+            return item
+
+    def allowed(self, url):
+        """robots.txt가 이 URL 수집을 허용하는지"""
+        allowed = self.get_rules(url)['parser'].can_fetch(self.user_agent, url)
+        with self.lock:
+            self.stats['allowed' if allowed else 'disallowed'] += 1
+        return allowed
+
+    def get_stats(self):
+        """전체 통계와 호스트별 상태 (status: robots.txt 응답 코드, delay: 적용한 Crawl-delay)"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['hosts'] = {host: {'status': item['status'], 'delay': item['delay']} for host, item in self.rules.items()}
+        return stats
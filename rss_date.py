@@ -0,0 +1,56 @@
+import calendar
+import time
+from email.utils import parsedate_tz
+
+# 한국 표준시 (1988년 이후 서머타임 없음)
+KST_OFFSET = 9 * 3600
+
+MONTHS = {name: i for i, name in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)}
+
+ZONES = {'GMT': 0, 'UTC': 0, 'UT': 0, 'Z': 0}
+
+def parse_zone(zone):
+    """'GMT' / '+0900' 형식의 시간대 -> UTC와의 차이(초), 모르는 형식이면 None"""
+    if zone in ZONES:
+        return ZONES[zone]
+    if len(zone) == 5 and zone[0] in '+-' and zone[1:].isdigit():
+        offset = int(zone[1:3]) * 3600 + int(zone[3:]) * 60
+        return -offset if zone[0] == '-' else offset
+    return None
+
+def parse_rss_date(value):
+    """
+    RSS pubDate(RFC 822) -> epoch 초
+    Google News 형식('Sat, 28 Jun 2025 08:00:00 GMT')은 문자열을 바로 잘라 계산하고,
+    그 밖의 형식은 email.utils로 처리 (읽을 수 없으면 None)
+    """
+    if not value:
+        return None
+    try:
+        parts = value.split()
+        if len(parts) == 6 and parts[0].endswith(','):
+            _, day, month, year, clock, zone = parts
+            offset = parse_zone(zone)
+            if offset is not None and month in MONTHS and len(clock) == 8:
+                return calendar.timegm((int(year), MONTHS[month], int(day),
+                                        int(clock[:2]), int(clock[3:5]), int(clock[6:]))) - offset
+    except ValueError:
+        pass
+
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return calendar.timegm(parsed[:6] + (0, 1, -1)) - (parsed[9] or 0)
+
+def format_kst(epoch):
+    """epoch 초 -> 한국 시간 'YYYY-MM-DD HH:MM:SS' (DB published 컬럼 형식)"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(epoch + KST_OFFSET))
+
+def kst_day(epoch):
+    """epoch 초 -> 한국 시간 기준 날짜 번호 (같은 날이면 같은 값, 일별 집계용)"""
+    return (epoch + KST_OFFSET) // 86400
+
+def format_kst_day(day):
+    """kst_day() 값 -> 'YYYY-MM-DD'"""
+    return time.strftime('%Y-%m-%d', time.gmtime(day * 86400))
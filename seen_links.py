@@ -0,0 +1,42 @@
+import threading
+from collections import OrderedDict
+
+class SeenLinks:
+    """
+    키워드별로 이미 저장한 링크의 메모리 캐시 (LRU)
+    - 키워드마다 최근에 본 링크 max_links개만 기억 (반복 실행 데몬에서도 메모리가 늘지 않음)
+    - 밀려난 링크는 DB 조회(querySelectExistingLinks)로 다시 확인하므로 중복 저장은 생기지 않음
+    """
+    def __init__(self, max_links=1000):
+        self.max_links = max_links
+        self.keywords = {}
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+
+    def contains(self, keyword, link):
+        """본 적 있는 링크인지 (있으면 최근 사용으로 갱신)"""
+        with self.lock:
+            links = self.keywords.get(keyword.lower())
+            if links is not None and link in links:
+                links.move_to_end(link)
+                self.stats['hits'] += 1
+                return True
+            self.stats['misses'] += 1
+            return False
+
+    def add(self, keyword, links):
+        with self.lock:
+            seen = self.keywords.setdefault(keyword.lower(), OrderedDict())
+            for link in links:
+                seen[link] = True
+                seen.move_to_end(link)
+            while len(seen) > self.max_links:
+                seen.popitem(last=False)
+                self.stats['evicted'] += 1
+
+    def get_stats(self):
+        """hits/misses: 메모리 캐시 적중/실패 수, evicted: 밀려난 링크 수, links: 현재 기억 중인 링크 수"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['links'] = sum(len(links) for links in self.keywords.values())
+        return stats
@@ -0,0 +1,91 @@
+from bs4 import Tag
+
+class SelectorMatcher:
+    """
+    여러 선택자를 DOM 한 번 순회로 평가하는 매처
+    - 지원 선택자: 'tag', '.class', '#id' (본문 선택자 목록에서 쓰는 형태)
+    - 결과 순서는 soup.select()와 같은 문서 순서, 우선순위는 selectors 순서
+    """
+    def __init__(self, selectors, extra_tags=('p',)):
+        self.selectors = list(selectors)
+        self.extra_tags = tuple(extra_tags)
+        self.by_tag = {}
+        self.by_class = {}
+        self.by_id = {}
+
+        for selector in self.selectors:
+            if selector.startswith('#'):
+                self.by_id.setdefault(selector[1:], []).append(selector)
+            elif selector.startswith('.'):
+                self.by_class.setdefault(selector[1:], []).append(selector)
+            elif selector.isalnum():
+                self.by_tag.setdefault(selector.lower(), []).append(selector)
+            else:
+                raise ValueError(f"지원하지 않는 선택자입니다: {selector}")
+
+        for tag in self.extra_tags:
+            self.by_tag.setdefault(tag, []).append(tag)
+
+    def collect(self, soup):
+        """선택자별 일치 요소 목록 (extra_tags 포함) - DOM은 한 번만 순회"""
+        matches = {selector: [] for selector in self.selectors}
+        for tag in self.extra_tags:
+            matches.setdefault(tag, [])
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            hit = self.by_tag.get(element.name)
+            if hit:
+                for selector in hit:
+                    matches[selector].append(element)
+
+            if self.by_id:
+                element_id = element.get('id')
+                if element_id in self.by_id:
+                    for selector in self.by_id[element_id]:
+                        matches[selector].append(element)
+
+            if self.by_class:
+                classes = element.get('class')
+                if classes:
+                    for class_name in set(classes):
+                        for selector in self.by_class.get(class_name, ()):
+                            matches[selector].append(element)
+
+        return matches
+
+    def first_match(self, matches, min_length, first_only=False, selectors=None):
+        """
+        우선순위가 가장 높은 선택자 중 텍스트 길이가 min_length를 넘는 첫 결과
+        - first_only=True: 선택자마다 첫 요소만 검사 (select_one 동작)
+        - selectors: 다른 우선순위로 검사할 때 지정 (생략하면 생성 시 순서)
+        반환값: (선택자, 텍스트) 또는 (None, None)
+        """
+        for selector in selectors or self.selectors:
+            elements = matches.get(selector, [])
+            if first_only:
+                elements = elements[:1]
+            for element in elements:
+                content = element.get_text(strip=True)
+                if len(content) > min_length:
+                    return selector, content
+        return None, None
+
+    def is_match(self, element, selector):
+        """요소 하나가 선택자와 일치하는지 검사"""
+        if selector.startswith('#'):
+            return element.get('id') == selector[1:]
+        if selector.startswith('.'):
+            return selector[1:] in (element.get('class') or ())
+        return element.name == selector.lower()
+
+    def find_content(self, soup, selector, min_length):
+        """선택자 하나만 검사하고 조건을 넘는 첫 요소에서 바로 멈춤 (학습된 선택자 빠른 경로)"""
+        for element in soup.descendants:
+            if isinstance(element, Tag) and self.is_match(element, selector):
+                content = element.get_text(strip=True)
+                if len(content) > min_length:
+                    return content
+        return None
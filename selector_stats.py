@@ -0,0 +1,109 @@
+import atexit
+import json
+import os
+import threading
+
+class AdaptiveSelectorStore:
+    """
+    도메인별로 실제 본문을 뽑아낸 선택자를 학습해 디스크(JSON)에 저장
+    - hits: 해당 선택자로 본문 추출에 성공한 횟수
+    - misses: 우선 시도했지만 본문을 얻지 못한 횟수 (실패하면 순위가 내려감)
+    """
+    def __init__(self, path='selector_stats.json', save_every=20):
+        self.path = path
+        self.save_every = save_every
+        self.lock = threading.Lock()
+        self.domains = {}
+        self.dirty = 0
+        self.load()
+        atexit.register(self.save)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.domains = json.load(f)
+        except Exception as e:
+            print(f"선택자 통계 읽기 오류: {e}")
+            self.domains = {}
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            data = json.dumps(self.domains, ensure_ascii=False, indent=2)
+            self.dirty = 0
+        # 임시 파일에 쓴 뒤 교체 (중간에 끊겨도 기존 파일 유지)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def _record(self, domain, selector, field):
+        with self.lock:
+            selectors = self.domains.setdefault(domain, {})
+            stats = selectors.setdefault(selector, {'hits': 0, 'misses': 0})
+            stats[field] += 1
+            self.dirty += 1
+            should_save = self.dirty >= self.save_every
+        if should_save:
+            self.save()
+
+    def record_hit(self, domain, selector):
+        self._record(domain, selector, 'hits')
+
+    def record_miss(self, domain, selector):
+        self._record(domain, selector, 'misses')
+
+    def score(self, stats):
+        return stats['hits'] - stats['misses']
+
+    def get_preferred(self, domain, exclude=('p',)):
+        """해당 도메인에서 가장 믿을 만한 선택자 (성공이 실패보다 많을 때만)"""
+        with self.lock:
+            selectors = self.domains.get(domain, {})
+            candidates = [(self.score(stats), selector) for selector, stats in selectors.items()
+                          if selector not in exclude and self.score(stats) > 0]
+        if not candidates:
+            return None
+        return max(candidates)[1]
+
+    def ordered_selectors(self, domain, selectors):
+        """
+        기본 우선순위를 학습 결과로 재정렬
+        - 성공 점수가 높은 선택자가 앞으로, 실패가 많은 선택자는 뒤로
+        - 점수가 같으면 원래 순서 유지
+        """
+        with self.lock:
+            learned = self.domains.get(domain, {})
+            scores = {selector: self.score(stats) for selector, stats in learned.items()}
+        if not scores:
+            return list(selectors)
+        return sorted(selectors, key=lambda selector: -scores.get(selector, 0))
+
+    def get_domain_stats(self, domain=None):
+        """도메인별 선택자 통계 (domain 생략 시 전체)"""
+        with self.lock:
+            if domain is not None:
+                return {selector: dict(stats) for selector, stats in self.domains.get(domain, {}).items()}
+            return {name: {selector: dict(stats) for selector, stats in selectors.items()}
+                    for name, selectors in self.domains.items()}
+
+    def print_stats(self):
+        print("🎯 도메인별 선택자 적중 통계")
+        for domain, selectors in sorted(self.get_domain_stats().items()):
+            ranked = sorted(selectors.items(), key=lambda item: -self.score(item[1]))
+            summary = ', '.join(f"{selector} {stats['hits']}/{stats['misses']}" for selector, stats in ranked)
+            print(f"   {domain}: {summary}")
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+def get_shared_store():
+    """프로세스 공용 선택자 통계 저장소"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = AdaptiveSelectorStore()
+        return _shared_store
@@ -1,6 +1,5 @@
 from google_news_cron import GoogleNewsCron
 import sys
-import time
 
 def simple_search(keyword, country='ko'):
     """
@@ -15,10 +14,11 @@ def simple_search(keyword, country='ko'):
     
     try:
         # 크롤링 실행
-        cron.run(mode='once', country=country, keyword=keyword)
+        future = cron.run(mode='once', country=country, keyword=keyword)
         
-        # 잠시 대기
-        time.sleep(3)
+        # 수집(본문 채우기 포함)이 끝날 때까지 대기
+        stats = future.result()
+        print(f"새 기사 {stats['new_articles']}개, 본문 {stats['filled']}개 채움 ({stats['elapsed']:.1f}초)")
         
         # 결과 확인
         results = cron.dbManager.querySelectAllGoogleNewsTable(keyword)
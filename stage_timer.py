@@ -0,0 +1,78 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# 크롤링 단계 이름 (표시 순서)
+STAGES = ('feed_fetch', 'date_parse', 'page_fetch', 'parse', 'extract', 'db_insert')
+
+def percentile(sorted_values, ratio):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(ratio * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+class StageTimer:
+    """
+    크롤링 단계별 소요 시간 기록
+    - 단계마다 최근 max_samples개의 측정값만 보관 (백분위수 계산용)
+    - 프로세스 풀에서 실행된 추출 단계는 작업 프로세스에 기록되므로 여기엔 잡히지 않음
+    """
+    def __init__(self, max_samples=10000):
+        self.max_samples = max_samples
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.totals = {}
+
+    @contextmanager
+    def measure(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage, seconds):
+        with self.lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.max_samples)
+                self.totals[stage] = [0, 0.0]
+            self.samples[stage].append(seconds)
+            self.totals[stage][0] += 1
+            self.totals[stage][1] += seconds
+
+    def reset(self):
+        with self.lock:
+            self.samples = {}
+            self.totals = {}
+
+    def get_stats(self):
+        """단계별 {count, total, avg, p50, p95, p99, max} (시간 단위: 밀리초)"""
+        with self.lock:
+            snapshot = {stage: (sorted(values), tuple(self.totals[stage])) for stage, values in self.samples.items()}
+
+        stats = {}
+        order = [stage for stage in STAGES if stage in snapshot] + sorted(set(snapshot) - set(STAGES))
+        for stage in order:
+            values, (count, total) = snapshot[stage]
+            stats[stage] = {
+                'count': count,
+                'total': total * 1000,
+                'avg': total / count * 1000 if count else 0.0,
+                'p50': percentile(values, 0.50) * 1000,
+                'p95': percentile(values, 0.95) * 1000,
+                'p99': percentile(values, 0.99) * 1000,
+                'max': (values[-1] if values else 0.0) * 1000,
+            }
+        return stats
+
+    def print_stats(self):
+        print("⏱️ 단계별 소요 시간 (ms)")
+        for stage, item in self.get_stats().items():
+            print(f"   {stage}: {item['count']}회, 평균 {item['avg']:.2f}, p50 {item['p50']:.2f}, "
+                  f"p95 {item['p95']:.2f}, p99 {item['p99']:.2f}, 최대 {item['max']:.2f}")
+
+# 모든 크롤러가 공유하는 기본 타이머
+shared_timer = StageTimer()
@@ -1,9 +1,10 @@
 # simple_debug.py - 간단한 문제 확인
 
 import sqlite3
-import requests
 from bs4 import BeautifulSoup
 
+from http_session import shared_session
+
 def check_database_simple():
     """데이터베이스 간단 확인"""
     print("🔍 데이터베이스 확인")
@@ -56,8 +57,9 @@ def check_database_simple():
     except Exception as e:
         print(f"오류: {e}")
 
-def test_crawling_simple():
-    """간단한 크롤링 테스트"""
+def test_crawling_simple(session=None):
+    """간단한 크롤링 테스트 (session: 기록/재생용 PooledHttpSession, 없으면 공용 세션)"""
+    session = session or shared_session
     print("🔍 크롤링 테스트")
     print("-" * 30)
     
@@ -70,7 +72,7 @@ def test_crawling_simple():
     
     try:
         print(f"테스트 URL: {test_url}")
-        response = requests.get(test_url, headers=headers, timeout=10)
+        response = session.get(test_url, headers=headers, timeout=10)
         print(f"응답 코드: {response.status_code}")
         
         if response.status_code == 200:
@@ -103,7 +105,7 @@ def check_current_code():
         
         # 중요한 부분들 확인
         checks = [
-            ('BeautifulSoup import', 'from bs4 import BeautifulSoup'),
+            ('본문 추출기 import', 'from content_extractor import'),
             ('get_content 함수', 'def get_content'),
             ('content 설정', "data['content']"),
             ('content 저장', 'content')
@@ -121,11 +123,26 @@ def check_current_code():
         print(f"오류: {e}")
 
 if __name__ == "__main__":
+    import argparse
+    from http_session import PooledHttpSession
+    from http_replay import HttpRecorder, install_replay
+
+    parser = argparse.ArgumentParser(description='간단한 문제 진단')
+    parser.add_argument('--record', metavar='DIR', help='받은 응답을 DIR에 기록')
+    parser.add_argument('--replay', metavar='URL', help='재생 서버로 오프라인 실행 (예: http://127.0.0.1:8780)')
+    args = parser.parse_args()
+
+    session = PooledHttpSession()
+    if args.record:
+        session.recorder = HttpRecorder(args.record)
+    if args.replay:
+        install_replay(session, args.replay)
+
     print("🛠️ 간단한 문제 진단")
     print("=" * 40)
     
     check_database_simple()
     print()
-    test_crawling_simple()
+    test_crawling_simple(session)
     print()
     check_current_code()
\ No newline at end of file
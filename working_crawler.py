@@ -103,13 +103,13 @@ def create_clean_version():
 from apscheduler.jobstores.base import JobLookupError
 import requests
 import datetime
-import maya
 import feedparser
 from bs4 import BeautifulSoup
 import time
 import random
 
 import google_news_dbmanager
+from rss_date import parse_rss_date, format_kst
 
 class GoogleNewsCron():
     def __init__(self):
@@ -189,7 +189,8 @@ class GoogleNewsCron():
                 
                 for i, data in enumerate(datas):
                     print(f"처리 중: {i+1}/{len(datas)} - {data.title}")
-                    data['published'] = maya.parse(data.published).datetime(to_timezone="Asia/Seoul", naive=True) 
+                    published_ts = parse_rss_date(data.get('published'))
+                    data['published'] = format_kst(published_ts) if published_ts is not None else data.get('published', '')
                     data['source'] = data.source.title
                     data['content'] = self.get_content(data.link)
                     self.dbManager.queryInsertGoogleNewsTable(data)